@@ -58,7 +58,9 @@ Examples:
         oracle_query = args.query
     else:
         try:
-            oracle_query = args.file.read_text(encoding='utf-8')
+            # read_bytes + decode avoids the universal-newline translation
+            # layer of text mode; SQL input doesn't need it
+            oracle_query = args.file.read_bytes().decode('utf-8')
         except FileNotFoundError:
             print(f"Error: File not found: {args.file}", file=sys.stderr)
             return 1
@@ -88,12 +90,15 @@ Examples:
         output_lines.append("=" * 70)
     output_lines.append(converted_query)
     
-    output_text = "\n".join(output_lines)
-    
-    # Write output
+    # Write output - stream the lines instead of materializing an extra
+    # joined copy of the full report
     if args.output:
         try:
-            args.output.write_text(output_text, encoding='utf-8')
+            # Binary mode skips the TextIOWrapper encode/newline layer
+            with args.output.open('wb') as out_file:
+                out_file.writelines(
+                    (line + '\n').encode('utf-8') for line in output_lines
+                )
             print(f"Conversion complete. Output written to: {args.output}")
             if warnings and not args.no_warnings:
                 print(f"\n{len(warnings)} warning(s) generated. Check output file.")
@@ -101,7 +106,8 @@ Examples:
             print(f"Error writing output file: {e}", file=sys.stderr)
             return 1
     else:
-        print(output_text)
+        sys.stdout.write('\n'.join(output_lines))
+        sys.stdout.write('\n')
     
     return 0
 
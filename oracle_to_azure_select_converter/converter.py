@@ -1,69 +1,260 @@
 """Main converter module for Oracle to Azure SQL SELECT query conversion.
 """
 
+import functools
 import re
-from typing import List, Tuple
+from typing import List, NamedTuple, Optional, Tuple
+
+# Optional compiled accelerator for the hot scalar scanners (argument
+# splitting, subquery detection). The package ships pure Python, so the
+# extension being absent is the normal case; when a _converter_fast
+# module (e.g. a Cython build) is importable, it takes over.
+try:
+    from . import _converter_fast
+except ImportError:
+    _converter_fast = None
+
+# Optional RE2 backend (google-re2 / pyre2). RE2 compiles to a DFA and
+# scans in linear time regardless of alternation width, which helps the
+# wide presence-only probe on large queries. Entirely optional.
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+
+def _compile_probe(pattern, flags):
+    """Compile a presence-only pattern, preferring RE2 when installed.
+
+    Falls back to the stdlib engine per-pattern if RE2 rejects the
+    syntax or flags. Only used for patterns whose matches are consumed
+    as booleans - dispatch patterns that rely on lastgroup stay on re.
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
 
 # Pre-compile regex patterns for better performance
-_CONNECT_BY_PATTERN = re.compile(r'\bCONNECT\s+BY\b', re.IGNORECASE)
-_ROWNUM_PATTERN = re.compile(r'\bROWNUM\b', re.IGNORECASE)
-_ORDER_BY_PATTERN = re.compile(r'\bORDER\s+BY\b', re.IGNORECASE)
-_DATE_ARITHMETIC_PATTERN = re.compile(r'\+\s*\d+\s*[/]\s*24|\+\s*INTERVAL', re.IGNORECASE)
-_SUBQUERY_PATTERN = re.compile(r'\(\s*SELECT\s+.*?\bWHERE\b.*?\)', re.IGNORECASE | re.DOTALL)
-_NVL_PATTERN = re.compile(r'\bNVL\s*\(((?:[^()]|\([^()]*\))*)\)', re.IGNORECASE)
-_DECODE_PATTERN = re.compile(r'\bDECODE\s*\(((?:[^()]|\([^()]*\))*)\)', re.IGNORECASE)
-_SYSDATE_PATTERN = re.compile(r'\bSYSDATE\b', re.IGNORECASE)
-_CONCAT_PATTERN = re.compile(r'\|\|')
-_TRUNC_PATTERN = re.compile(r'\bTRUNC\s*\(', re.IGNORECASE)
-_FROM_DUAL_PATTERN = re.compile(r'\s*\bFROM\s+DUAL\b\s*', re.IGNORECASE)
-_ROWNUM_WHERE_PATTERN = re.compile(r'\b(WHERE|AND)\s+ROWNUM\s*(<=?|<)\s*(\d+)', re.IGNORECASE)
-_SELECT_PATTERN = re.compile(r'\bSELECT\b', re.IGNORECASE)
-_ADD_MONTHS_PATTERN = re.compile(r'\bADD_MONTHS\s*\(', re.IGNORECASE)
-_SUBSTR_PATTERN = re.compile(r'\bSUBSTR\s*\(', re.IGNORECASE)
-_TO_CHAR_PATTERN = re.compile(r'\bTO_CHAR\s*\(', re.IGNORECASE)
-_FETCH_FIRST_PATTERN = re.compile(r'\bFETCH\s+FIRST\s+(\d+)\s+ROWS?\s+ONLY', re.IGNORECASE)
-_LISTAGG_PATTERN = re.compile(r'\bLISTAGG\s*\(((?:DISTINCT\s+)?[^,)]+),\s*\'([^\']+)\'\)(?:\s+WITHIN\s+GROUP\s*\(\s*ORDER\s+BY\s+([^)]+)\))?', re.IGNORECASE)
-_REGEXP_LIKE_PATTERN = re.compile(r'\bREGEXP_LIKE\s*\(([^,]+),\s*\'([^\']+)\'(?:,\s*\'([^\']+)\')?\)', re.IGNORECASE)
-_OPTIMIZER_HINTS_PATTERN = re.compile(r'/\*\+[^*]*\*/', re.IGNORECASE)
-_USING_CLAUSE_PATTERN = re.compile(r'\bUSING\s*\(([^)]+)\)', re.IGNORECASE)
-_DATE_LITERAL_PATTERN = re.compile(r'\bDATE\s+\'([^\']+)\'', re.IGNORECASE)
-_FETCH_WITH_TIES_PATTERN = re.compile(r'\bFETCH\s+FIRST\s+(\d+)\s+ROWS?\s+WITH\s+TIES', re.IGNORECASE)
-_MONTHS_BETWEEN_PATTERN = re.compile(r'\bMONTHS_BETWEEN\s*\(([^,]+),\s*([^)]+)\)', re.IGNORECASE)
-_REGEXP_SUBSTR_PATTERN = re.compile(r'\bREGEXP_SUBSTR\s*\(', re.IGNORECASE)
-_PIVOT_PATTERN = re.compile(r'\bPIVOT\s*\(', re.IGNORECASE)
-_LENGTH_PATTERN = re.compile(r'\bLENGTH\s*\(', re.IGNORECASE)
-# Match INSTR with proper nesting support: INSTR(string, substring [, start_position])
-_INSTR_PATTERN = re.compile(
-    r'\bINSTR\s*\(([^,()]+(?:\([^()]*\))?[^,]*),\s*([^,()]+(?:\([^()]*\))?[^,]*)(?:,\s*([^)]+))?\)',
-    re.IGNORECASE
+# The presence-only feature detectors fused into one alternation; a single
+# finditer pass records which named groups occur instead of one full
+# re.search scan per feature. ROWNUM and ORDER BY ride along so their
+# co-occurrence check needs no extra scans. Compiled case-sensitive and
+# run against an uppercased copy of the query - that skips the engine's
+# per-comparison case folding, and spans don't matter for presence tests.
+_FEATURE_PATTERN = re.compile(
+    r'(?P<connect_by>\bCONNECT\s+BY\b)'
+    r'|(?P<rownum>\bROWNUM\b)'
+    r'|(?P<order_by>\bORDER\s+BY\b)'
+    r'|(?P<date_arith>\+\s*\d+\s*/\s*24|\+\s*INTERVAL)'
+    r'|(?P<pivot>\bPIVOT\s*\()'
+    r'|(?P<keep_dense_rank>\bKEEP\s*\(\s*DENSE_RANK\s+(?:FIRST|LAST))'
+    r'|(?P<tuple_in>\([^)]+,\s*[^)]+\)\s+IN\s*\()'
+    r'|(?P<regexp_substr>\bREGEXP_SUBSTR\s*\()',
+    re.ASCII
 )
-_CEIL_PATTERN = re.compile(r'\bCEIL\s*\(', re.IGNORECASE)
-_INITCAP_PATTERN = re.compile(r'\bINITCAP\s*\(([^)]+)\)', re.IGNORECASE)
-_TRIM_PATTERN = re.compile(r'\bTRIM\s*\(([^()]+(?:\([^()]*\))*)\)', re.IGNORECASE)
-_KEEP_DENSE_RANK_PATTERN = re.compile(r'\bKEEP\s*\(\s*DENSE_RANK\s+(FIRST|LAST)', re.IGNORECASE)
-_TUPLE_IN_PATTERN = re.compile(r'\([^)]+,\s*[^)]+\)\s+IN\s*\(', re.IGNORECASE)
+_NVL_OPEN_PATTERN = re.compile(r'\bNVL\s*\(', re.IGNORECASE | re.ASCII)
+_DECODE_PATTERN = re.compile(r'\bDECODE\s*\(((?:[^()]|\([^()]*\))*)\)', re.IGNORECASE | re.ASCII)
+_TRUNC_PATTERN = re.compile(r'\bTRUNC\s*\(', re.IGNORECASE | re.ASCII)
+# Single alternation covering the simple one-token rewrites (SYSDATE,
+# FROM DUAL) so they are applied in one scan instead of one pass each.
+# || -> + is a fixed-literal rewrite handled by str.replace instead.
+_SIMPLE_TOKEN_PATTERN = re.compile(
+    r'(?P<sysdate>\bSYSDATE\b)|(?P<dual>\s*\bFROM\s+DUAL\b\s*)'
+    r'|(?P<length>\bLENGTH\s*\()|(?P<ceil>\bCEIL\s*\()|(?P<substr>\bSUBSTR\s*\()',
+    re.IGNORECASE | re.ASCII
+)
+_ROWNUM_WHERE_PATTERN = re.compile(r'\b(WHERE|AND)\s+ROWNUM\s*(<=?|<)\s*(\d+)', re.IGNORECASE | re.ASCII)
+_SELECT_PATTERN = re.compile(r'\bSELECT\b', re.IGNORECASE | re.ASCII)
+_ADD_MONTHS_PATTERN = re.compile(r'\bADD_MONTHS\s*\(', re.IGNORECASE | re.ASCII)
+_TO_CHAR_PATTERN = re.compile(r'\bTO_CHAR\s*\(', re.IGNORECASE | re.ASCII)
+_FETCH_FIRST_PATTERN = re.compile(r'\bFETCH\s+FIRST\s+(\d+)\s+ROWS?\s+ONLY', re.IGNORECASE | re.ASCII)
+_LISTAGG_PATTERN = re.compile(r'\bLISTAGG\s*\(((?:DISTINCT\s+)?[^,)]+),\s*\'([^\']+)\'\)(?:\s+WITHIN\s+GROUP\s*\(\s*ORDER\s+BY\s+([^)]+)\))?', re.IGNORECASE | re.ASCII)
+_DISTINCT_STRIP_PATTERN = re.compile(r'\bDISTINCT\s+', re.IGNORECASE | re.ASCII)
+_REGEXP_LIKE_PATTERN = re.compile(r'\bREGEXP_LIKE\s*\(([^,]+),\s*\'([^\']+)\'(?:,\s*\'([^\']+)\')?\)', re.IGNORECASE | re.ASCII)
+_OPTIMIZER_HINTS_PATTERN = re.compile(r'/\*\+[^*]*\*/', re.IGNORECASE | re.ASCII)
+_USING_CLAUSE_PATTERN = re.compile(r'\bUSING\s*\(([^)]+)\)', re.IGNORECASE | re.ASCII)
+_DATE_LITERAL_PATTERN = re.compile(r'\bDATE\s+\'([^\']+)\'', re.IGNORECASE | re.ASCII)
+_FETCH_WITH_TIES_PATTERN = re.compile(r'\bFETCH\s+FIRST\s+(\d+)\s+ROWS?\s+WITH\s+TIES', re.IGNORECASE | re.ASCII)
+_MONTHS_BETWEEN_PATTERN = re.compile(r'\bMONTHS_BETWEEN\s*\(([^,]+),\s*([^)]+)\)', re.IGNORECASE | re.ASCII)
+_INSTR_OPEN_PATTERN = re.compile(r'\bINSTR\s*\(', re.IGNORECASE | re.ASCII)
+_INITCAP_PATTERN = re.compile(r'\bINITCAP\s*\(([^)]+)\)', re.IGNORECASE | re.ASCII)
+_TRIM_PATTERN = re.compile(r'\bTRIM\s*\(([^()]+(?:\([^()]*\))*)\)', re.IGNORECASE | re.ASCII)
+# One-shot probe for anything the conversion pipeline could rewrite; if
+# nothing matches (e.g. already-converted SQL pasted into the GUI) the
+# pipeline is skipped entirely and only detection warnings run
+_PROBE_PATTERN = _compile_probe(
+    r'\|\||&|/\*\+'
+    r'|\b(?:NVL|DECODE|SYSDATE|TRUNC|ROWNUM|DUAL|LENGTH|INSTR|CEIL|INITCAP|TRIM'
+    r'|SUBSTR|TO_CHAR|ADD_MONTHS|MONTHS_BETWEEN|LISTAGG|REGEXP_LIKE|FETCH|USING|DATE)\b',
+    re.IGNORECASE | re.ASCII
+)
+# HTML entities decoded up front, all in one alternation pass
+_HTML_ENTITY_MAP = {
+    '&gt;': '>',
+    '&lt;': '<',
+    '&amp;': '&',
+    '&quot;': '"',
+    '&apos;': "'",
+}
+_HTML_ENTITY_PATTERN = re.compile('|'.join(_HTML_ENTITY_MAP))
+# Multi-keyword scan over the lowercased query: one pass collects every
+# gate token that occurs (the pure-Python stand-in for an Aho-Corasick
+# automaton - the re engine walks its compiled alternation once in C),
+# so the per-pass guards become set lookups instead of substring scans
+_KEYWORD_SCAN_PATTERN = re.compile(
+    r'/\*\+'
+    r'|\b(?:nvl|decode|trunc|rownum|instr|initcap|trim|to_char|add_months'
+    r'|months_between|listagg|regexp_like|fetch|using|date)\b',
+    re.ASCII
+)
+_ORPHAN_WHERE_AND_PATTERN = re.compile(r'\bWHERE\s+AND\b', re.IGNORECASE | re.ASCII)
+_ORPHAN_AND_AND_PATTERN = re.compile(r'\bAND\s+AND\b', re.IGNORECASE | re.ASCII)
+# Tokens that matter when splitting function arguments: quoted strings
+# (consumed whole so their contents can't affect depth), parens, commas
+_ARG_TOKEN_PATTERN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|[(),]")
+_SELECT_START_PATTERN = re.compile(r'\s*(?:SELECT|WITH)\b', re.IGNORECASE | re.ASCII)
+_BLOCK_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+_LINE_COMMENT_PATTERN = re.compile(r'--.*?$', re.MULTILINE)
+# ADD_MONTHS year shorthand: -12 * n or n * -12
+_YEAR_MULT_PATTERN = re.compile(r'-12\s*\*\s*(\d+)|(\d+)\s*\*\s*-12')
+# SQL keywords are ASCII, so case-fold with a translation table instead
+# of str.upper() and its Unicode-aware case mapping
+_ASCII_UPPER = str.maketrans('abcdefghijklmnopqrstuvwxyz',
+                             'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+# Tokens that matter when matching parentheses: the parens themselves and
+# quoted strings, consumed whole so literal parens can't skew the depth
+_PAREN_TOKEN_PATTERN = re.compile(r"[()]|'(?:[^']|'')*'")
 
 
-class ConversionWarning:
-    """Represents a warning generated during conversion."""
-    
-    def __init__(self, message: str, line_number: int = None, warning_type: str = 'GENERAL'):
-        self.message = message
-        self.line_number = line_number
-        self.warning_type = warning_type
-    
+def _find_matching_paren(s: str, open_pos: int) -> int:
+    """Return the index of the ')' closing the '(' at `open_pos`, or -1.
+
+    Scans with a token regex so the engine jumps straight between parens
+    and string literals instead of stepping one character at a time.
+    """
+    depth = 0
+    for match in _PAREN_TOKEN_PATTERN.finditer(s, open_pos):
+        token = match.group()
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+            if depth == 0:
+                return match.start()
+    return -1
+
+
+class ConversionWarning(NamedTuple):
+    """Represents a warning generated during conversion.
+
+    A NamedTuple keeps warnings immutable and per-instance dict-free,
+    which matters when a query generates many of them.
+    """
+
+    message: str
+    line_number: Optional[int] = None
+    warning_type: str = 'GENERAL'
+
     def __str__(self):
-        if self.line_number:
-            return f"⚠ WARNING (Line {self.line_number}): {self.message}"
-        return f"⚠ WARNING: {self.message}"
+        return _render_warning(self)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_warning(warning: ConversionWarning) -> str:
+    """Format a warning for display, memoized per instance value.
+
+    Warnings are rendered repeatedly (console, GUI panel, report files)
+    and the canned instances below are shared across queries, so caching
+    the formatted string makes repeat serialization a dict hit.
+    """
+    if warning.line_number:
+        return f"⚠ WARNING (Line {warning.line_number}): {warning.message}"
+    return f"⚠ WARNING: {warning.message}"
+
+
+# Canned warnings for fixed-message cases. ConversionWarning is an
+# immutable NamedTuple, so a single shared instance per message is safe
+# to hand out repeatedly instead of re-allocating one per detection.
+_INVALID_INPUT_WARNING = ConversionWarning(
+    "Invalid input: Query must be a non-empty string."
+)
+_NOT_SELECT_WARNING = ConversionWarning(
+    "Query does not appear to be a SELECT statement. Only SELECT queries are supported."
+)
+_CONNECT_BY_WARNING = ConversionWarning(
+    "CONNECT BY hierarchical query detected. SQL Server requires recursive CTE with anchor + recursive member using UNION ALL.",
+    warning_type='CONNECT_BY'
+)
+_ROWNUM_ORDER_BY_WARNING = ConversionWarning(
+    "ROWNUM used with ORDER BY. Results may differ - consider ROW_NUMBER() OVER(ORDER BY ...) instead.",
+    warning_type='ROWNUM_ORDER_BY'
+)
+_DATE_ARITHMETIC_WARNING = ConversionWarning(
+    "Complex date arithmetic detected. Verify DATEADD() conversion is semantically correct.",
+    warning_type='DATE_ARITHMETIC'
+)
+_CORRELATED_SUBQUERY_WARNING = ConversionWarning(
+    "Possible correlated subquery detected. Verify query logic after conversion.",
+    warning_type='CORRELATED_SUBQUERY'
+)
+_PIVOT_WARNING = ConversionWarning(
+    "Oracle PIVOT syntax detected. SQL Server PIVOT uses different syntax. Consider conditional aggregation instead.",
+    warning_type='PIVOT'
+)
+_KEEP_DENSE_RANK_WARNING = ConversionWarning(
+    "Oracle KEEP (DENSE_RANK FIRST/LAST) detected. SQL Server requires ROW_NUMBER() with partitioning instead. Manual rewrite needed.",
+    warning_type='KEEP_DENSE_RANK'
+)
+_TUPLE_IN_WARNING = ConversionWarning(
+    "Tuple comparison in IN clause detected: (col1, col2) IN (...). SQL Server doesn't support this. Rewrite as: EXISTS (SELECT 1 FROM ... WHERE col1=... AND col2=...)",
+    warning_type='TUPLE_IN'
+)
+_REGEXP_SUBSTR_WARNING = ConversionWarning(
+    "REGEXP_SUBSTR detected. SQL Server 2025+ supports this natively; older versions need SUBSTRING+CHARINDEX fallback.",
+    warning_type='REGEXP_SUBSTR'
+)
+
+# Pipeline stage tuples specialized per feature set, keyed by the
+# frozenset of gate tokens present in a query. Bounded by the number of
+# distinct token combinations actually seen, which in practice is small.
+_DISPATCH_CACHE = {}
 
 
 class OracleToAzureConverter:
     """Converts Oracle SELECT queries to Azure SQL format."""
-    
+
+    __slots__ = ('warnings', '_tokens', '_needs_cleanup', '_warned_keys')
+
     def __init__(self):
         self.warnings: List[ConversionWarning] = []
-    
+        # (warning_type, message) pairs already emitted for the current
+        # query; keeps repeated hits from flooding the warning list
+        self._warned_keys = set()
+        # Gate tokens found by the one-pass keyword scan in convert()
+        self._tokens: Optional[frozenset] = None
+        # Set by passes that splice text out and may leave doubled
+        # spaces or orphaned WHERE/AND keywords behind
+        self._needs_cleanup = False
+
+    def _warn(self, warning: ConversionWarning) -> None:
+        """Append a warning unless an identical one was already emitted."""
+        key = (warning.warning_type, warning.message)
+        if key not in self._warned_keys:
+            self._warned_keys.add(key)
+            self.warnings.append(warning)
+
+    def _absent(self, token: str) -> bool:
+        """True when the current query provably lacks `token`.
+
+        Conservative: returns False when no token set is available
+        (e.g. a pass invoked outside convert()), so the pass still runs.
+        """
+        tokens = self._tokens
+        return tokens is not None and token not in tokens
+
     def convert(self, oracle_query: str) -> Tuple[str, List[ConversionWarning]]:
         """
         Convert an Oracle SELECT query to Azure SQL format.
@@ -75,51 +266,62 @@ class OracleToAzureConverter:
             Tuple of (converted_query, list_of_warnings)
         """
         self.warnings = []
-        
+        self._warned_keys = set()
+
         # Input validation
         if not oracle_query or not isinstance(oracle_query, str):
-            self.warnings.append(
-                ConversionWarning("Invalid input: Query must be a non-empty string.")
-            )
+            self._warn(_INVALID_INPUT_WARNING)
             return oracle_query if oracle_query else "", self.warnings
         
         # Validate it's a SELECT query
         if not self._is_select_query(oracle_query):
-            self.warnings.append(
-                ConversionWarning("Query does not appear to be a SELECT statement. Only SELECT queries are supported.")
-            )
+            self._warn(_NOT_SELECT_WARNING)
             return oracle_query, self.warnings
         
         # Check for unsupported features first
         self._detect_unsupported_features(oracle_query)
-        
-        # Apply conversions in order
+
+        # Nothing convertible in the query? Skip all conversion passes.
+        if not _PROBE_PATTERN.search(oracle_query):
+            return oracle_query, self.warnings
+
+        # Lowercase once and collect every gate token in a single
+        # alternation pass; the per-pass guards then reduce to set
+        # lookups. No pass introduces another pass's Oracle-side token,
+        # so the set stays valid across the pipeline.
+        self._tokens = frozenset(
+            _KEYWORD_SCAN_PATTERN.findall(oracle_query.lower())
+        )
+
+        # Apply the conversion pipeline in order, specialized to the
+        # feature set: queries with the same gate tokens share a cached
+        # stage tuple, so the common 2-3-feature query runs 2-3 passes
+        # instead of stepping through every no-op helper
+        key = self._tokens & self._GATE_TOKENS
+        stages = _DISPATCH_CACHE.get(key)
+        if stages is None:
+            stages = tuple(
+                stage for stage, token in self._PIPELINE
+                if token is None or token in key
+            )
+            _DISPATCH_CACHE[key] = stages
+
         converted = oracle_query
-        converted = self._decode_html_entities(converted)
-        converted = self._remove_optimizer_hints(converted)
-        converted = self._convert_date_literals(converted)
-        converted = self._convert_using_clause(converted)
-        converted = self._convert_months_between(converted)
-        converted = self._convert_fetch_with_ties(converted)
-        converted = self._convert_length(converted)
-        converted = self._convert_instr(converted)
-        converted = self._convert_ceil(converted)
-        converted = self._convert_trim(converted)
-        converted = self._convert_initcap(converted)
-        converted = self._convert_listagg(converted)
-        converted = self._convert_regexp_like(converted)
-        converted = self._convert_nvl(converted)
-        converted = self._convert_decode(converted)
-        converted = self._convert_sysdate(converted)
-        converted = self._convert_string_concatenation(converted)
-        converted = self._convert_date_trunc(converted)
-        converted = self._convert_substr(converted)
-        converted = self._convert_to_char(converted)
-        converted = self._convert_add_months(converted)
-        converted = self._remove_from_dual(converted)
-        converted = self._convert_rownum_to_top(converted)
-        converted = self._convert_fetch_first(converted)
-        
+        self._needs_cleanup = False
+        for stage in stages:
+            converted = stage(self, converted)
+
+        # One shared cleanup pass, only when a stage spliced text out and
+        # may have left orphaned keywords or doubled spaces behind
+        if self._needs_cleanup:
+            if _ORPHAN_WHERE_AND_PATTERN.search(converted):
+                converted = _ORPHAN_WHERE_AND_PATTERN.sub('WHERE', converted)
+            if _ORPHAN_AND_AND_PATTERN.search(converted):
+                converted = _ORPHAN_AND_AND_PATTERN.sub('AND', converted)
+            while '  ' in converted:
+                converted = converted.replace('  ', ' ')
+
+        self._tokens = None
         return converted, self.warnings
     
     def _decode_html_entities(self, query: str) -> str:
@@ -127,12 +329,13 @@ class OracleToAzureConverter:
         Decode HTML entities like &gt;, &lt;, &amp; to their actual characters.
         Must be done FIRST before any pattern matching.
         """
-        query = query.replace('&gt;', '>')
-        query = query.replace('&lt;', '<')
-        query = query.replace('&amp;', '&')
-        query = query.replace('&quot;', '"')
-        query = query.replace('&apos;', "'")
-        return query
+        # The common case has no entities at all - one membership test
+        # short-circuits five string scans
+        if '&' not in query:
+            return query
+        return _HTML_ENTITY_PATTERN.sub(
+            lambda m: _HTML_ENTITY_MAP[m.group()], query
+        )
     
     def _convert_listagg(self, query: str) -> str:
         """
@@ -142,63 +345,73 @@ class OracleToAzureConverter:
         DISTINCT handling: Oracle's LISTAGG(DISTINCT col) must use a subquery approach
         to preserve distinct semantics in SQL Server.
         """
-        def replace_listagg(match):
-            distinct_col = match.group(1).strip()  # May include DISTINCT
-            delimiter = match.group(2)
-            order_by = match.group(3)  # May be None
+        if self._absent('listagg'):
+            return query
+        out = []
+        last = 0
+        for match in _LISTAGG_PATTERN.finditer(query):
+            out.append(query[last:match.start()])
+            out.append(self._listagg_repl(match))
+            last = match.end()
+        out.append(query[last:])
+        return ''.join(out)
+
+    def _listagg_repl(self, match) -> str:
+        """Build the STRING_AGG replacement for one LISTAGG match."""
+        distinct_col = match.group(1).strip()  # May include DISTINCT
+        delimiter = match.group(2)
+        order_by = match.group(3)  # May be None
+        
+        # Check if DISTINCT is used
+        has_distinct = 'DISTINCT' in distinct_col.translate(_ASCII_UPPER)
+        if has_distinct:
+            # Extract column name after DISTINCT
+            col_name = _DISTINCT_STRIP_PATTERN.sub('', distinct_col).strip()
             
-            # Check if DISTINCT is used
-            has_distinct = 'DISTINCT' in distinct_col.upper()
-            if has_distinct:
-                # Extract column name after DISTINCT
-                col_name = re.sub(r'\bDISTINCT\s+', '', distinct_col, flags=re.IGNORECASE).strip()
-                
-                # Extract just the column name without table alias for the subquery
-                # If col_name is like 'rc.dx3', extract just 'dx3'
-                col_parts = col_name.split('.')
-                base_col = col_parts[-1] if '.' in col_name else col_name
-                
-                # Generate subquery pattern to preserve DISTINCT semantics
-                # Pattern: (SELECT STRING_AGG(x.col, ',') FROM (SELECT DISTINCT col FROM ...) AS x)
-                # Note: This is a placeholder - user needs to adapt it to their query context
-                
-                if order_by:
-                    # With WITHIN GROUP ordering - extract base order column too
-                    order_parts = order_by.split('.')
-                    base_order = order_parts[-1] if '.' in order_by else order_by
-                    
-                    result = (
-                        f"/* LISTAGG(DISTINCT {col_name}, '{delimiter}') WITHIN GROUP (ORDER BY {order_by}) */\n"
-                        f"        (SELECT STRING_AGG(x.{base_col}, '{delimiter}') WITHIN GROUP (ORDER BY x.{base_order})\n"
-                        f"         FROM (SELECT DISTINCT {col_name} FROM <source_table>) AS x)"
-                    )
-                else:
-                    result = (
-                        f"/* LISTAGG(DISTINCT {col_name}, '{delimiter}') */\n"
-                        f"        (SELECT STRING_AGG(x.{base_col}, '{delimiter}')\n"
-                        f"         FROM (SELECT DISTINCT {col_name} FROM <source_table>) AS x)"
-                    )
+            # Extract just the column name without table alias for the subquery
+            # If col_name is like 'rc.dx3', extract just 'dx3'
+            col_parts = col_name.split('.')
+            base_col = col_parts[-1] if '.' in col_name else col_name
+            
+            # Generate subquery pattern to preserve DISTINCT semantics
+            # Pattern: (SELECT STRING_AGG(x.col, ',') FROM (SELECT DISTINCT col FROM ...) AS x)
+            # Note: This is a placeholder - user needs to adapt it to their query context
+            
+            if order_by:
+                # With WITHIN GROUP ordering - extract base order column too
+                order_parts = order_by.split('.')
+                base_order = order_parts[-1] if '.' in order_by else order_by
                 
-                self.warnings.append(
-                    ConversionWarning(
-                        f'LISTAGG(DISTINCT {col_name}) converted to correlated subquery pattern. '
-                        f"MANUAL FIX REQUIRED: Replace <source_table> with actual table/CTE name and add WHERE correlation. "
-                        f"Example for grouped query: (SELECT STRING_AGG(x.dx3, ',') FROM (SELECT DISTINCT rc2.dx3 FROM recent_claims AS rc2 WHERE rc2.member_id = rc.member_id) AS x)",
-                        warning_type='LISTAGG_DISTINCT'
-                    )
+                result = (
+                    f"/* LISTAGG(DISTINCT {col_name}, '{delimiter}') WITHIN GROUP (ORDER BY {order_by}) */\n"
+                    f"        (SELECT STRING_AGG(x.{base_col}, '{delimiter}') WITHIN GROUP (ORDER BY x.{base_order})\n"
+                    f"         FROM (SELECT DISTINCT {col_name} FROM <source_table>) AS x)"
                 )
             else:
-                column = distinct_col
-                # Build STRING_AGG without DISTINCT
-                if order_by:
-                    result = f"STRING_AGG({column}, '{delimiter}') WITHIN GROUP (ORDER BY {order_by})"
-                else:
-                    result = f"STRING_AGG({column}, '{delimiter}')"
+                result = (
+                    f"/* LISTAGG(DISTINCT {col_name}, '{delimiter}') */\n"
+                    f"        (SELECT STRING_AGG(x.{base_col}, '{delimiter}')\n"
+                    f"         FROM (SELECT DISTINCT {col_name} FROM <source_table>) AS x)"
+                )
             
-            return result
+            self._warn(
+                ConversionWarning(
+                    f'LISTAGG(DISTINCT {col_name}) converted to correlated subquery pattern. '
+                    f"MANUAL FIX REQUIRED: Replace <source_table> with actual table/CTE name and add WHERE correlation. "
+                    f"Example for grouped query: (SELECT STRING_AGG(x.dx3, ',') FROM (SELECT DISTINCT rc2.dx3 FROM recent_claims AS rc2 WHERE rc2.member_id = rc.member_id) AS x)",
+                    warning_type='LISTAGG_DISTINCT'
+                )
+            )
+        else:
+            column = distinct_col
+            # Build STRING_AGG without DISTINCT
+            if order_by:
+                result = f"STRING_AGG({column}, '{delimiter}') WITHIN GROUP (ORDER BY {order_by})"
+            else:
+                result = f"STRING_AGG({column}, '{delimiter}')"
         
-        return _LISTAGG_PATTERN.sub(replace_listagg, query)
-    
+        return result
+
     def _convert_regexp_like(self, query: str) -> str:
         """
         Convert Oracle REGEXP_LIKE to SQL Server alternatives.
@@ -212,162 +425,212 @@ class OracleToAzureConverter:
         - Use PATINDEX for slightly more complex patterns
         - Warn about limitations
         """
-        def replace_regexp_like(match):
-            column = match.group(1).strip()
-            pattern = match.group(2)
-            flags = match.group(3) if match.group(3) else ''
-            
-            # For SQL Server 2025+ / Azure SQL compat >= 170, use native REGEXP_LIKE
-            # Add a comment to indicate version requirement
-            native_regexp = f"REGEXP_LIKE({column}, '{pattern}'{', ' + repr(flags) if flags else ''})"
-            
-            # Add warning about version requirements
-            self.warnings.append(
-                ConversionWarning(
-                    f"REGEXP_LIKE({column}, '{pattern}') detected. "
-                    f'SQL Server 2025 (17.x) / Azure SQL with compatibility level >= 170 supports native REGEXP_LIKE. '
-                    f'For older versions, replace with LIKE pattern or PATINDEX. '
-                    f'Current conversion uses native REGEXP_LIKE - ensure your SQL Server version supports it.',
-                    warning_type='REGEXP_LIKE'
-                )
+        if self._absent('regexp_like'):
+            return query
+        out = []
+        last = 0
+        for match in _REGEXP_LIKE_PATTERN.finditer(query):
+            out.append(query[last:match.start()])
+            out.append(self._regexp_like_repl(match))
+            last = match.end()
+        out.append(query[last:])
+        return ''.join(out)
+
+    def _regexp_like_repl(self, match) -> str:
+        """Build the replacement text for one REGEXP_LIKE match."""
+        column = match.group(1).strip()
+        pattern = match.group(2)
+        flags = match.group(3) if match.group(3) else ''
+        
+        # For SQL Server 2025+ / Azure SQL compat >= 170, use native REGEXP_LIKE
+        # Add a comment to indicate version requirement
+        native_regexp = f"REGEXP_LIKE({column}, '{pattern}'{', ' + repr(flags) if flags else ''})"
+        
+        # Add warning about version requirements
+        self._warn(
+            ConversionWarning(
+                f"REGEXP_LIKE({column}, '{pattern}') detected. "
+                f'SQL Server 2025 (17.x) / Azure SQL with compatibility level >= 170 supports native REGEXP_LIKE. '
+                f'For older versions, replace with LIKE pattern or PATINDEX. '
+                f'Current conversion uses native REGEXP_LIKE - ensure your SQL Server version supports it.',
+                warning_type='REGEXP_LIKE'
             )
-            
-            # Try to provide a LIKE alternative as a comment for older versions
-            like_alternative = None
-            
-            # Simple pattern conversions
-            if pattern == '^[A-Z]':
-                like_alternative = f"{column} LIKE '[A-Z]%' COLLATE Latin1_General_CS_AS"
-            elif pattern == '^[a-z]':
-                like_alternative = f"{column} LIKE '[a-z]%' COLLATE Latin1_General_CS_AS"
-            elif pattern == '^[0-9]' or pattern == '^\\d':
-                like_alternative = f"{column} LIKE '[0-9]%'"
-            elif pattern.startswith('^') and not any(c in pattern[1:] for c in ['|', '[', '(', '+', '*', '?', '$', '.', '\\']):
-                like_alternative = f"{column} LIKE '{pattern[1:]}%'"
-            elif pattern.endswith('$') and not any(c in pattern[:-1] for c in ['|', '[', '(', '+', '*', '?', '^', '.', '\\']):
-                like_alternative = f"{column} LIKE '%{pattern[:-1]}'"
-            elif pattern == '.*':
-                like_alternative = f"{column} IS NOT NULL"
-            
-            # Return native REGEXP_LIKE with optional LIKE alternative as comment
-            if like_alternative:
-                return f"{native_regexp}  /* For older SQL Server: {like_alternative} */"
-            else:
-                return f"{native_regexp}  /* WARNING: Requires SQL Server 2025+ or Azure SQL compat >= 170 */"
+        )
         
-        return _REGEXP_LIKE_PATTERN.sub(replace_regexp_like, query)
+        # Try to provide a LIKE alternative as a comment for older versions
+        like_alternative = None
+        
+        # Simple pattern conversions
+        if pattern == '^[A-Z]':
+            like_alternative = f"{column} LIKE '[A-Z]%' COLLATE Latin1_General_CS_AS"
+        elif pattern == '^[a-z]':
+            like_alternative = f"{column} LIKE '[a-z]%' COLLATE Latin1_General_CS_AS"
+        elif pattern == '^[0-9]' or pattern == '^\\d':
+            like_alternative = f"{column} LIKE '[0-9]%'"
+        elif pattern.startswith('^') and not any(c in pattern[1:] for c in ['|', '[', '(', '+', '*', '?', '$', '.', '\\']):
+            like_alternative = f"{column} LIKE '{pattern[1:]}%'"
+        elif pattern.endswith('$') and not any(c in pattern[:-1] for c in ['|', '[', '(', '+', '*', '?', '^', '.', '\\']):
+            like_alternative = f"{column} LIKE '%{pattern[:-1]}'"
+        elif pattern == '.*':
+            like_alternative = f"{column} IS NOT NULL"
+        
+        # Return native REGEXP_LIKE with optional LIKE alternative as comment
+        if like_alternative:
+            return f"{native_regexp}  /* For older SQL Server: {like_alternative} */"
+        return f"{native_regexp}  /* WARNING: Requires SQL Server 2025+ or Azure SQL compat >= 170 */"
     
     def _is_select_query(self, query: str) -> bool:
         """Check if query is a SELECT statement."""
-        # Remove comments before checking
-        query_cleaned = re.sub(r'/\*.*?\*/', '', query, flags=re.DOTALL)  # Remove /* */ comments
-        query_cleaned = re.sub(r'--.*?$', '', query_cleaned, flags=re.MULTILINE)  # Remove -- comments
-        query_upper = query_cleaned.strip().upper()
-        return query_upper.startswith('SELECT') or query_upper.startswith('WITH')
+        # Fast path: anchored case-insensitive match skips leading
+        # whitespace inside the pattern, so no stripped/uppercased copy
+        # of the query is allocated
+        if _SELECT_START_PATTERN.match(query):
+            return True
+        # Slow path: the query may start with comments - strip them first
+        query_cleaned = _BLOCK_COMMENT_PATTERN.sub('', query)  # Remove /* */ comments
+        query_cleaned = _LINE_COMMENT_PATTERN.sub('', query_cleaned)  # Remove -- comments
+        return _SELECT_START_PATTERN.match(query_cleaned.strip()) is not None
     
     def _detect_unsupported_features(self, query: str):
         """Detect features that require manual review."""
-        # Check for CONNECT BY (hierarchical queries)
-        if _CONNECT_BY_PATTERN.search(query):
-            self.warnings.append(
-                ConversionWarning(
-                    "CONNECT BY hierarchical query detected. SQL Server requires recursive CTE with anchor + recursive member using UNION ALL.",
-                    warning_type='CONNECT_BY'
-                )
-            )
-        
-        # Check for ROWNUM with ORDER BY (pagination issue)
-        if self._has_rownum_with_order_by(query):
-            self.warnings.append(
-                ConversionWarning(
-                    "ROWNUM used with ORDER BY. Results may differ - consider ROW_NUMBER() OVER(ORDER BY ...) instead.",
-                    warning_type='ROWNUM_ORDER_BY'
-                )
-            )
-        
-        # Check for complex date arithmetic
-        if _DATE_ARITHMETIC_PATTERN.search(query):
-            self.warnings.append(
-                ConversionWarning(
-                    "Complex date arithmetic detected. Verify DATEADD() conversion is semantically correct.",
-                    warning_type='DATE_ARITHMETIC'
-                )
-            )
-        
-        # Check for correlated subqueries (informational warning)
+        # Hoist the bound method - this runs up to eight lookups
+        # per query otherwise
+        warn = self._warn
+
+        # One pass over an uppercased copy records which features occur
+        # (the pattern is case-sensitive, see its definition); warnings
+        # are emitted afterwards in the established order
+        q_upper = query.translate(_ASCII_UPPER)
+        seen = {m.lastgroup for m in _FEATURE_PATTERN.finditer(q_upper)}
+
+        # CONNECT BY (hierarchical queries)
+        if 'connect_by' in seen:
+            warn(_CONNECT_BY_WARNING)
+
+        # ROWNUM with ORDER BY (pagination issue)
+        if 'rownum' in seen and 'order_by' in seen:
+            warn(_ROWNUM_ORDER_BY_WARNING)
+
+        # Complex date arithmetic
+        if 'date_arith' in seen:
+            warn(_DATE_ARITHMETIC_WARNING)
+
+        # Correlated subqueries (informational warning)
         if self._has_correlated_subquery(query):
-            self.warnings.append(
-                ConversionWarning(
-                    "Possible correlated subquery detected. Verify query logic after conversion.",
-                    warning_type='CORRELATED_SUBQUERY'
-                )
-            )
-        
-        # Check for Oracle PIVOT syntax
-        if _PIVOT_PATTERN.search(query):
-            self.warnings.append(
-                ConversionWarning(
-                    "Oracle PIVOT syntax detected. SQL Server PIVOT uses different syntax. Consider conditional aggregation instead.",
-                    warning_type='PIVOT'
-                )
-            )
-        
-        # Check for KEEP/DENSE_RANK (Oracle analytic)
-        if _KEEP_DENSE_RANK_PATTERN.search(query):
-            self.warnings.append(
-                ConversionWarning(
-                    "Oracle KEEP (DENSE_RANK FIRST/LAST) detected. SQL Server requires ROW_NUMBER() with partitioning instead. Manual rewrite needed.",
-                    warning_type='KEEP_DENSE_RANK'
-                )
-            )
-        
-        # Check for tuple IN comparisons
-        if _TUPLE_IN_PATTERN.search(query):
-            self.warnings.append(
-                ConversionWarning(
-                    "Tuple comparison in IN clause detected: (col1, col2) IN (...). SQL Server doesn't support this. Rewrite as: EXISTS (SELECT 1 FROM ... WHERE col1=... AND col2=...)",
-                    warning_type='TUPLE_IN'
-                )
-            )
-        
-        # Check for REGEXP_SUBSTR
-        if _REGEXP_SUBSTR_PATTERN.search(query):
-            self.warnings.append(
-                ConversionWarning(
-                    "REGEXP_SUBSTR detected. SQL Server 2025+ supports this natively; older versions need SUBSTRING+CHARINDEX fallback.",
-                    warning_type='REGEXP_SUBSTR'
-                )
-            )
-        
+            warn(_CORRELATED_SUBQUERY_WARNING)
+
+        # Oracle PIVOT syntax
+        if 'pivot' in seen:
+            warn(_PIVOT_WARNING)
+
+        # KEEP/DENSE_RANK (Oracle analytic)
+        if 'keep_dense_rank' in seen:
+            warn(_KEEP_DENSE_RANK_WARNING)
+
+        # Tuple IN comparisons
+        if 'tuple_in' in seen:
+            warn(_TUPLE_IN_WARNING)
+
+        # REGEXP_SUBSTR
+        if 'regexp_substr' in seen:
+            warn(_REGEXP_SUBSTR_WARNING)
+
         # LISTAGG and REGEXP_LIKE are now converted automatically
         # Warnings are generated during conversion if needed
     
-    def _has_rownum_with_order_by(self, query: str) -> bool:
-        """Check if ROWNUM is used together with ORDER BY."""
-        return bool(_ROWNUM_PATTERN.search(query) and _ORDER_BY_PATTERN.search(query))
-    
     def _has_correlated_subquery(self, query: str) -> bool:
-        """Detect potential correlated subqueries (basic heuristic)."""
-        return bool(_SUBQUERY_PATTERN.search(query))
+        """
+        Detect potential correlated subqueries (basic heuristic).
+
+        Does a single paren-depth scan looking for a parenthesized SELECT
+        that contains a WHERE before its closing paren. The previous regex
+        (`\\(\\s*SELECT\\s+.*?\\bWHERE\\b.*?\\)` with DOTALL) could
+        backtrack quadratically on large queries with nested parentheses;
+        this scan is linear and skips string literals.
+        """
+        if _converter_fast is not None:
+            return _converter_fast.has_correlated_subquery(query)
+
+        stack = []  # per open paren: True/False = SELECT group saw WHERE, None = plain group
+        i = 0
+        n = len(query)
+        while i < n:
+            ch = query[i]
+            if ch == "'":
+                # Skip string literal contents
+                end = query.find("'", i + 1)
+                if end == -1:
+                    break
+                i = end + 1
+                continue
+            if ch == '(':
+                j = i + 1
+                while j < n and query[j].isspace():
+                    j += 1
+                if query[j:j + 6].translate(_ASCII_UPPER) == 'SELECT':
+                    stack.append(False)
+                    i = j + 6
+                    continue
+                stack.append(None)
+            elif ch == ')':
+                if stack and stack.pop():
+                    return True
+            elif ch in 'wW' and query[i:i + 5].translate(_ASCII_UPPER) == 'WHERE':
+                # Check word boundaries so identifiers like NOWHERE don't match
+                before_ok = i == 0 or not (query[i - 1].isalnum() or query[i - 1] == '_')
+                after_ok = i + 5 >= n or not (query[i + 5].isalnum() or query[i + 5] == '_')
+                if before_ok and after_ok:
+                    # Mark the innermost enclosing SELECT group
+                    for k in range(len(stack) - 1, -1, -1):
+                        if stack[k] is not None:
+                            stack[k] = True
+                            break
+                i += 5
+                continue
+            i += 1
+        return False
     
     def _convert_nvl(self, query: str) -> str:
         """
         Convert Oracle NVL(a, b) to SQL Server ISNULL(a, b).
         NVL returns the first non-null argument.
-        Handles nested NVL by applying recursively.
+
+        Single left-to-right pass: each NVL( is paired with its closing
+        paren, the argument text is converted recursively for nested
+        calls, and fragments are joined once at the end. This replaces
+        the old fixed-point loop that re-ran the pattern over the whole
+        query until nothing changed.
         """
-        # Apply pattern multiple times to handle nested NVL
-        prev = None
-        while prev != query:
-            prev = query
-            query = _NVL_PATTERN.sub(lambda m: f"ISNULL({m.group(1)})", query)
-        return query
+        if self._absent('nvl'):
+            return query
+        pieces = []
+        pos = 0
+        while True:
+            match = _NVL_OPEN_PATTERN.search(query, pos)
+            if not match:
+                break
+
+            paren_start = match.end() - 1
+            close = _find_matching_paren(query, paren_start)
+            if close == -1:
+                # Malformed - keep the rest as-is
+                break
+
+            inner = self._convert_nvl(query[paren_start + 1:close])
+            pieces.append(query[pos:match.start()])
+            pieces.append(f"ISNULL({inner})")
+            pos = close + 1
+
+        pieces.append(query[pos:])
+        return ''.join(pieces)
     
     def _convert_decode(self, query: str) -> str:
         """
         Convert Oracle DECODE to ANSI CASE WHEN.
         DECODE(expr, search1, result1, search2, result2, ..., default)
         """
+        if self._absent('decode'):
+            return query
         def replace_decode(match):
             parts = self._split_decode_args(match.group(1).strip())
             
@@ -393,196 +656,170 @@ class OracleToAzureConverter:
         return _DECODE_PATTERN.sub(replace_decode, query)
     
     def _split_function_args(self, content: str) -> List[str]:
-        """Split function arguments respecting nested parentheses and quotes."""
-        parts = []
-        current = []
-        depth = 0
-        in_quote = False
-        quote_char = None
-        
-        for char in content:
-            if char in ("'", '"') and not in_quote:
-                in_quote = True
-                quote_char = char
-                current.append(char)
-            elif char == quote_char and in_quote:
-                in_quote = False
-                quote_char = None
-                current.append(char)
-            elif char == '(' and not in_quote:
-                depth += 1
-                current.append(char)
-            elif char == ')' and not in_quote:
-                depth -= 1
-                current.append(char)
-            elif char == ',' and depth == 0 and not in_quote:
-                parts.append(''.join(current).strip())
-                current = []
-            else:
-                current.append(char)
-        
-        if current:
-            parts.append(''.join(current).strip())
-        
-        return parts
-    
-    def _split_decode_args(self, content: str) -> List[str]:
-        """Split DECODE arguments respecting nested parentheses and quoted strings."""
+        """
+        Split function arguments respecting nested parentheses and quoted strings.
+
+        Driven by a token regex (quoted string | paren | comma) so the
+        character walking happens inside the regex engine; Python only
+        sees one iteration per structural token instead of per character.
+        """
+        if not content:
+            return []
+        if _converter_fast is not None:
+            return _converter_fast.split_decode_args(content)
+
         parts = []
-        current = []
+        last = 0
         depth = 0
-        in_quote = False
-        quote_char = None
-        
-        for char in content:
-            if char in ("'", '"') and not in_quote:
-                in_quote = True
-                quote_char = char
-                current.append(char)
-            elif char == quote_char and in_quote:
-                in_quote = False
-                quote_char = None
-                current.append(char)
-            elif char == '(' and not in_quote:
+
+        for match in _ARG_TOKEN_PATTERN.finditer(content):
+            token = match.group()
+            if token == '(':
                 depth += 1
-                current.append(char)
-            elif char == ')' and not in_quote:
+            elif token == ')':
                 depth -= 1
-                current.append(char)
-            elif char == ',' and depth == 0 and not in_quote:
-                parts.append(''.join(current).strip())
-                current = []
-            else:
-                current.append(char)
-        
-        if current:
-            parts.append(''.join(current).strip())
-        
+            elif token == ',' and depth == 0:
+                parts.append(content[last:match.start()].strip())
+                last = match.end()
+
+        parts.append(content[last:].strip())
         return parts
-    
-    def _convert_sysdate(self, query: str) -> str:
-        """
-        Convert Oracle SYSDATE to SQL Server GETDATE().
-        SYSDATE returns current date and time.
-        """
-        return _SYSDATE_PATTERN.sub('GETDATE()', query)
-    
-    def _convert_string_concatenation(self, query: str) -> str:
-        """
-        Convert Oracle string concatenation (||) to SQL Server (+).
-        Handle cases where || is used between columns/literals.
-        """
-        return _CONCAT_PATTERN.sub('+', query)
-    
-    def _convert_substr(self, query: str) -> str:
+
+    # DECODE used to have its own argument splitter; both call sites now
+    # share the tokenized implementation above
+    _split_decode_args = _split_function_args
+
+    def _convert_simple_tokens(self, query: str) -> str:
         """
-        Convert Oracle SUBSTR to SQL Server SUBSTRING.
-        Both have same syntax: SUBSTR/SUBSTRING(string, start, length)
+        Apply the simple single-token conversions:
+        - || -> + (string concatenation)
+        - SYSDATE -> GETDATE()
+        - FROM DUAL -> removed (FROM clause is optional in SQL Server)
+        - LENGTH( -> LEN(, CEIL( -> CEILING(, SUBSTR( -> SUBSTRING(
+
+        || is a fixed literal, so the C-level str.replace scan beats the
+        regex engine for it; the case-insensitive keywords share one
+        alternation so they are rewritten in a single scan. The function
+        renames can ride along because only the name changes - the
+        argument lists are compatible as-is.
         """
-        return _SUBSTR_PATTERN.sub('SUBSTRING(', query)
-    
+        query = query.replace('||', '+')
+
+        def dispatch(match):
+            group = match.lastgroup
+            if group == 'sysdate':
+                return 'GETDATE()'
+            if group == 'length':
+                return 'LEN('
+            if group == 'ceil':
+                return 'CEILING('
+            if group == 'substr':
+                return 'SUBSTRING('
+            # FROM DUAL: the pattern consumes surrounding whitespace, so
+            # only the gap itself needs patching - keep a newline if the
+            # removed span crossed one to preserve the user's formatting
+            return '\n' if '\n' in match.group() else ' '
+
+        return _SIMPLE_TOKEN_PATTERN.sub(dispatch, query)
+
     def _convert_to_char(self, query: str) -> str:
         """
         Convert Oracle TO_CHAR(date, format) to SQL Server CONVERT.
         Common format 'YYYY-MM-DD' maps to style 120 (ISO format without time).
         """
-        result = query
+        if self._absent('to_char'):
+            return query
+        pieces = []
+        pos = 0
         while True:
-            match = _TO_CHAR_PATTERN.search(result)
+            match = _TO_CHAR_PATTERN.search(query, pos)
             if not match:
                 break
-            
+
             # Find matching closing paren
             paren_start = match.end() - 1
-            depth = 1
-            pos = paren_start + 1
-            
-            while pos < len(result) and depth > 0:
-                if result[pos] == '(':
-                    depth += 1
-                elif result[pos] == ')':
-                    depth -= 1
-                pos += 1
-            
-            if depth == 0:
-                # Extract the content between parentheses
-                content = result[paren_start + 1:pos - 1].strip()
-                parts = self._split_function_args(content)
-                
-                if len(parts) >= 2:
-                    date_expr = parts[0].strip()
-                    format_str = parts[1].strip().strip("'")
-                    
-                    # Map common Oracle date formats to SQL Server styles
-                    if format_str.upper() in ('YYYY-MM-DD', 'YYYY-MM-DD HH24:MI:SS'):
-                        # Style 120: yyyy-mm-dd hh:mi:ss (or just date part with VARCHAR(10))
-                        replacement = f"CONVERT(VARCHAR(10), {date_expr}, 120)"
-                    else:
-                        # Generic conversion - may need manual adjustment
-                        replacement = f"FORMAT({date_expr}, '{format_str}')"
-                    
-                    # Replace the entire TO_CHAR(...) call
-                    result = result[:match.start()] + replacement + result[pos:]
-                else:
-                    # Can't parse, skip this occurrence
-                    break
-            else:
-                # Couldn't find matching paren, skip
+            close = _find_matching_paren(query, paren_start)
+            if close == -1:
+                # Couldn't find matching paren, keep the rest as-is
                 break
-        
-        return result
+
+            # Convert nested TO_CHAR calls inside the arguments first
+            content = self._convert_to_char(query[paren_start + 1:close]).strip()
+            parts = self._split_function_args(content)
+
+            if len(parts) < 2:
+                # Can't parse, leave this occurrence untouched
+                pieces.append(query[pos:close + 1])
+                pos = close + 1
+                continue
+
+            date_expr = parts[0].strip()
+            format_str = parts[1].strip().strip("'")
+
+            # Map common Oracle date formats to SQL Server styles
+            if format_str.translate(_ASCII_UPPER) in ('YYYY-MM-DD', 'YYYY-MM-DD HH24:MI:SS'):
+                # Style 120: yyyy-mm-dd hh:mi:ss (or just date part with VARCHAR(10))
+                replacement = f"CONVERT(VARCHAR(10), {date_expr}, 120)"
+            else:
+                # Generic conversion - may need manual adjustment
+                replacement = f"FORMAT({date_expr}, '{format_str}')"
+
+            pieces.append(query[pos:match.start()])
+            pieces.append(replacement)
+            pos = close + 1
+
+        pieces.append(query[pos:])
+        return ''.join(pieces)
     
     def _convert_add_months(self, query: str) -> str:
         """
         Convert Oracle ADD_MONTHS(date, n) to SQL Server DATEADD(MONTH, n, date).
         Also handles special cases like -12 * 18 for years.
         """
-        result = query
+        if self._absent('add_months'):
+            return query
+        pieces = []
+        pos = 0
         while True:
-            match = _ADD_MONTHS_PATTERN.search(result)
+            match = _ADD_MONTHS_PATTERN.search(query, pos)
             if not match:
                 break
-            
+
             # Find matching closing paren
             paren_start = match.end() - 1
-            depth = 1
-            pos = paren_start + 1
-            
-            while pos < len(result) and depth > 0:
-                if result[pos] == '(':
-                    depth += 1
-                elif result[pos] == ')':
-                    depth -= 1
-                pos += 1
-            
-            if depth == 0:
-                # Extract the content between parentheses
-                content = result[paren_start + 1:pos - 1].strip()
-                parts = self._split_function_args(content)
-                
-                if len(parts) == 2:
-                    date_expr = parts[0].strip()
-                    months_expr = parts[1].strip()
-                    
-                    # Check if it's a multiple of 12 (years)
-                    # Pattern: -12 * n or n * -12
-                    year_match = re.match(r'-12\s*\*\s*(\d+)|(\d+)\s*\*\s*-12', months_expr)
-                    if year_match:
-                        years = year_match.group(1) or year_match.group(2)
-                        replacement = f"DATEADD(YEAR, -{years}, {date_expr})"
-                    else:
-                        replacement = f"DATEADD(MONTH, {months_expr}, {date_expr})"
-                    
-                    # Replace the entire ADD_MONTHS(...) call
-                    result = result[:match.start()] + replacement + result[pos:]
-                else:
-                    # Can't parse, skip this occurrence
-                    break
-            else:
-                # Couldn't find matching paren, skip
+            close = _find_matching_paren(query, paren_start)
+            if close == -1:
+                # Couldn't find matching paren, keep the rest as-is
                 break
-        
-        return result
+
+            # Convert nested ADD_MONTHS calls inside the arguments first
+            content = self._convert_add_months(query[paren_start + 1:close]).strip()
+            parts = self._split_function_args(content)
+
+            if len(parts) != 2:
+                # Can't parse, leave this occurrence untouched
+                pieces.append(query[pos:close + 1])
+                pos = close + 1
+                continue
+
+            date_expr = parts[0].strip()
+            months_expr = parts[1].strip()
+
+            # Check if it's a multiple of 12 (years)
+            # Pattern: -12 * n or n * -12
+            year_match = _YEAR_MULT_PATTERN.match(months_expr)
+            if year_match:
+                years = year_match.group(1) or year_match.group(2)
+                replacement = f"DATEADD(YEAR, -{years}, {date_expr})"
+            else:
+                replacement = f"DATEADD(MONTH, {months_expr}, {date_expr})"
+
+            pieces.append(query[pos:match.start()])
+            pieces.append(replacement)
+            pos = close + 1
+
+        pieces.append(query[pos:])
+        return ''.join(pieces)
     
     def _convert_date_trunc(self, query: str) -> str:
         """
@@ -590,76 +827,72 @@ class OracleToAzureConverter:
         TRUNC removes time portion from datetime.
         Handles nested function calls like TRUNC(GETDATE()).
         """
-        # Process from right to left to handle nested TRUNC calls
+        if self._absent('trunc'):
+            return query
+        pieces = []
+        pos = 0
         while True:
-            match = _TRUNC_PATTERN.search(query)
+            match = _TRUNC_PATTERN.search(query, pos)
             if not match:
                 break
-            
+
             # Find the matching closing paren for TRUNC(
-            start = match.start()
             paren_start = match.end() - 1  # Position of opening (
-            depth = 1
-            pos = paren_start + 1
-            
-            while pos < len(query) and depth > 0:
-                if query[pos] == '(':
-                    depth += 1
-                elif query[pos] == ')':
-                    depth -= 1
-                pos += 1
-            
-            if depth == 0:
-                # Extract the content between TRUNC( and matching )
-                content = query[paren_start + 1:pos - 1].strip()
-                replacement = f"CAST({content} AS DATE)"
-                query = query[:start] + replacement + query[pos:]
-            else:
-                # Malformed - skip this match
+            close = _find_matching_paren(query, paren_start)
+            if close == -1:
+                # Malformed - keep the rest as-is
                 break
-        
-        return query
-    
-    def _remove_from_dual(self, query: str) -> str:
-        """
-        Remove FROM DUAL clause (Oracle's dummy table).
-        In SQL Server, FROM clause is optional for SELECT without tables.
-        """
-        # Remove FROM DUAL but preserve general formatting
-        converted = _FROM_DUAL_PATTERN.sub(' ', query)
-        # Only collapse multiple spaces to single space (not newlines)
-        return re.sub(r' {2,}', ' ', converted)
+
+            # Convert nested TRUNC calls inside the argument first
+            content = self._convert_date_trunc(query[paren_start + 1:close]).strip()
+            pieces.append(query[pos:match.start()])
+            pieces.append(f"CAST({content} AS DATE)")
+            pos = close + 1
+
+        pieces.append(query[pos:])
+        return ''.join(pieces)
     
     def _convert_rownum_to_top(self, query: str) -> str:
         """
         Convert WHERE ROWNUM <= N or AND ROWNUM <= N to SELECT TOP N.
         Note: This is a simple conversion. Complex ROWNUM usage needs manual review.
         """
-        match = _ROWNUM_WHERE_PATTERN.search(query)
-        
-        if match:
-            keyword, operator, limit_str = match.groups()
-            limit = int(limit_str) - 1 if operator == '<' else int(limit_str)
-            
-            # Remove the ROWNUM clause
-            converted = _ROWNUM_WHERE_PATTERN.sub('', query)
-            
-            # Clean up any double spaces or orphaned AND/WHERE
-            converted = re.sub(r'\bWHERE\s+AND\b', 'WHERE', converted, flags=re.IGNORECASE)
-            converted = re.sub(r'\bAND\s+AND\b', 'AND', converted, flags=re.IGNORECASE)
-            converted = re.sub(r' {2,}', ' ', converted)
-            
-            # Add TOP N after SELECT
-            converted = _SELECT_PATTERN.sub(f'SELECT TOP {limit}', converted, count=1)
-            return converted
-        
-        return query
+        if self._absent('rownum'):
+            return query
+        matches = list(_ROWNUM_WHERE_PATTERN.finditer(query))
+
+        if not matches:
+            return query
+
+        keyword, operator, limit_str = matches[0].groups()
+        limit = int(limit_str) - 1 if operator == '<' else int(limit_str)
+
+        # Remove the ROWNUM clause(s) by splicing out the matched spans;
+        # the orphaned AND/WHERE and double spaces this can leave are
+        # fixed by the shared cleanup pass at the end of convert()
+        pieces = []
+        pos = 0
+        for match in matches:
+            pieces.append(query[pos:match.start()])
+            pos = match.end()
+        pieces.append(query[pos:])
+        converted = ''.join(pieces)
+        self._needs_cleanup = True
+
+        # Add TOP N after the first SELECT via a direct slice insertion
+        select_match = _SELECT_PATTERN.search(converted)
+        if select_match:
+            end = select_match.end()
+            converted = f'{converted[:end]} TOP {limit}{converted[end:]}'
+        return converted
     
     def _convert_fetch_first(self, query: str) -> str:
         """
         Convert Oracle FETCH FIRST n ROWS ONLY to Azure SQL OFFSET 0 ROWS FETCH NEXT n ROWS ONLY.
         Azure SQL requires OFFSET before FETCH.
         """
+        if self._absent('fetch'):
+            return query
         def replace_fetch(match):
             n = match.group(1)
             return f'OFFSET 0 ROWS FETCH NEXT {n} ROWS ONLY'
@@ -671,14 +904,19 @@ class OracleToAzureConverter:
         Remove Oracle optimizer hints (/*+ ... */) and add a warning.
         Azure SQL doesn't support Oracle optimizer hints.
         """
-        if _OPTIMIZER_HINTS_PATTERN.search(query):
-            self.warnings.append(ConversionWarning(
-                'Oracle optimizer hints (/*+ ... */) have been removed. Azure SQL uses query hints with different syntax. Review execution plans.',
-                warning_type='OPTIMIZER_HINTS'
-            ))
-            return _OPTIMIZER_HINTS_PATTERN.sub(' ', query)
-        
-        return query
+        if self._absent('/*+'):
+            return query
+        converted, count = _OPTIMIZER_HINTS_PATTERN.subn(' ', query)
+        if not count:
+            return query
+        # The hint is spliced out with a bare space, so doubled spaces can
+        # be left behind for the shared cleanup pass
+        self._needs_cleanup = True
+        self._warn(ConversionWarning(
+            'Oracle optimizer hints (/*+ ... */) have been removed. Azure SQL uses query hints with different syntax. Review execution plans.',
+            warning_type='OPTIMIZER_HINTS'
+        ))
+        return converted
     
     def _convert_using_clause(self, query: str) -> str:
         """
@@ -688,14 +926,9 @@ class OracleToAzureConverter:
         
         Note: This is a best-effort conversion. Manual review required for complex cases.
         """
-        if not _USING_CLAUSE_PATTERN.search(query):
+        if self._absent('using'):
             return query
-        
-        self.warnings.append(ConversionWarning(
-            'USING clause detected. Converted to ON clause - verify table aliases are correct.',
-            warning_type='USING_CLAUSE'
-        ))
-        
+
         # Simple conversion: USING (col) -> ON alias.col = outer_alias.col
         # Note: This requires context to determine correct aliases, so we provide a pattern
         def replace_using(match):
@@ -703,8 +936,17 @@ class OracleToAzureConverter:
             # We can't reliably determine the table aliases from regex alone
             # So we convert to a placeholder that user must complete
             return f"ON {column} /* TODO: Add table aliases - e.g., ON t.{column} = outer.{column} */"
-        
-        return _USING_CLAUSE_PATTERN.sub(replace_using, query)
+
+        # subn detects and rewrites in one scan
+        converted, count = _USING_CLAUSE_PATTERN.subn(replace_using, query)
+        if not count:
+            return query
+
+        self._warn(ConversionWarning(
+            'USING clause detected. Converted to ON clause - verify table aliases are correct.',
+            warning_type='USING_CLAUSE'
+        ))
+        return converted
     
     def _convert_date_literals(self, query: str) -> str:
         """
@@ -712,6 +954,8 @@ class OracleToAzureConverter:
         Oracle: DATE '2025-01-01'
         SQL Server: '2025-01-01' (implicit conversion) or CAST('2025-01-01' AS DATE)
         """
+        if self._absent('date'):
+            return query
         def replace_date_literal(match):
             date_value = match.group(1)
             # Use explicit CAST for clarity
@@ -727,32 +971,25 @@ class OracleToAzureConverter:
         
         Note: This requires moving the clause from end to SELECT - flagged for manual review.
         """
-        if _FETCH_WITH_TIES_PATTERN.search(query):
-            self.warnings.append(ConversionWarning(
+        if self._absent('fetch'):
+            return query
+
+        # Remove the FETCH clause and suggest TOP usage
+        def replace_fetch_ties(match):
+            n = match.group(1)
+            return f"-- FETCH FIRST {n} ROWS WITH TIES: Use SELECT TOP ({n}) WITH TIES instead"
+
+        converted, count = _FETCH_WITH_TIES_PATTERN.subn(replace_fetch_ties, query)
+        if count:
+            self._warn(ConversionWarning(
                 'FETCH FIRST n ROWS WITH TIES detected. In SQL Server, use TOP (n) WITH TIES in the SELECT clause instead. '
                 'OFFSET/FETCH does not support WITH TIES in SQL Server.',
                 warning_type='FETCH_WITH_TIES'
             ))
-            
-            # Remove the FETCH clause and suggest TOP usage
-            def replace_fetch_ties(match):
-                n = match.group(1)
-                return f"-- FETCH FIRST {n} ROWS WITH TIES: Use SELECT TOP ({n}) WITH TIES instead"
-            
-            return _FETCH_WITH_TIES_PATTERN.sub(replace_fetch_ties, query)
+            return converted
         
         return query
     
-    def _convert_length(self, query: str) -> str:
-        """
-        Convert Oracle LENGTH() to SQL Server LEN().
-        Oracle: LENGTH(string)
-        SQL Server: LEN(string)
-        
-        Note: Behavior is nearly identical.
-        """
-        return _LENGTH_PATTERN.sub('LEN(', query)
-    
     def _convert_instr(self, query: str) -> str:
         """
         Convert Oracle INSTR to SQL Server CHARINDEX.
@@ -760,114 +997,84 @@ class OracleToAzureConverter:
         SQL Server: CHARINDEX(substring, string [, start_location])
         
         Note: Parameters are REVERSED for the first two arguments!
-        Uses innermost-first replacement to handle nested calls.
+
+        Emits fragments left to right into a list buffer (joined once at
+        the end) so each rewrite costs the length of the fragment, not a
+        re-splice of the whole query; nested calls are handled by
+        recursing into the argument text before swapping.
         """
-        # Simple pattern for INSTR - we'll parse arguments manually
-        instr_pattern = re.compile(r'\bINSTR\s*\(', re.IGNORECASE)
-        
-        max_iterations = 20
-        iterations = 0
-        
-        while instr_pattern.search(query) and iterations < max_iterations:
-            iterations += 1
-            match = instr_pattern.search(query)
+        if self._absent('instr'):
+            return query
+        pieces = []
+        pos = 0
+        while True:
+            match = _INSTR_OPEN_PATTERN.search(query, pos)
             if not match:
                 break
-                
-            start_pos = match.end() - 1  # Position of opening paren
-            
-            # Find matching closing paren
-            paren_count = 0
-            args_start = match.end()
-            i = start_pos
-            
-            while i < len(query):
-                if query[i] == '(':
-                    paren_count += 1
-                elif query[i] == ')':
-                    paren_count -= 1
-                    if paren_count == 0:
-                        # Found the matching closing paren
-                        args_str = query[args_start:i]
-                        
-                        # Parse arguments (split by comma not inside parentheses)
-                        args = self._split_args(args_str)
-                        
-                        if len(args) == 2:
-                            # INSTR(str, substr) → CHARINDEX(substr, str)
-                            replacement = f"CHARINDEX({args[1].strip()}, {args[0].strip()})"
-                        elif len(args) == 3:
-                            # INSTR(str, substr, start) → CHARINDEX(substr, str, start)
-                            replacement = f"CHARINDEX({args[1].strip()}, {args[0].strip()}, {args[2].strip()})"
-                        else:
-                            # Keep as-is if unexpected argument count
-                            i += 1
-                            continue
-                        
-                        # Replace this INSTR call
-                        query = query[:match.start()] + replacement + query[i+1:]
-                        break
-                i += 1
-        
-        return query
-    
-    def _split_args(self, args_str: str) -> list:
-        """Split comma-separated arguments, respecting nested parentheses."""
-        args = []
-        current_arg = []
-        paren_depth = 0
-        
-        for char in args_str:
-            if char == '(' :
-                paren_depth += 1
-                current_arg.append(char)
-            elif char == ')':
-                paren_depth -= 1
-                current_arg.append(char)
-            elif char == ',' and paren_depth == 0:
-                args.append(''.join(current_arg))
-                current_arg = []
+
+            paren_start = match.end() - 1
+            close = _find_matching_paren(query, paren_start)
+            if close == -1:
+                # Malformed - keep the rest as-is
+                break
+
+            # Convert any nested INSTR calls inside the argument list
+            # first, then split and swap the outer arguments
+            inner = self._convert_instr(query[paren_start + 1:close])
+            args = self._split_function_args(inner)
+
+            if len(args) == 2:
+                # INSTR(str, substr) → CHARINDEX(substr, str)
+                replacement = f"CHARINDEX({args[1].strip()}, {args[0].strip()})"
+            elif len(args) == 3:
+                # INSTR(str, substr, start) → CHARINDEX(substr, str, start)
+                replacement = f"CHARINDEX({args[1].strip()}, {args[0].strip()}, {args[2].strip()})"
             else:
-                current_arg.append(char)
-        
-        if current_arg:
-            args.append(''.join(current_arg))
-        
-        return args
-    
-    def _convert_ceil(self, query: str) -> str:
-        """
-        Convert Oracle CEIL() to SQL Server CEILING().
-        Oracle: CEIL(number)
-        SQL Server: CEILING(number)
-        
-        Functionality is identical.
-        """
-        return _CEIL_PATTERN.sub('CEILING(', query)
-    
+                # Keep as-is if unexpected argument count
+                pieces.append(query[pos:close + 1])
+                pos = close + 1
+                continue
+
+            pieces.append(query[pos:match.start()])
+            pieces.append(replacement)
+            pos = close + 1
+
+        pieces.append(query[pos:])
+        return ''.join(pieces)
+
     def _convert_initcap(self, query: str) -> str:
         """
         Convert Oracle INITCAP() to a TitleCase approximation.
         Oracle: INITCAP(string) - capitalizes first letter of each word
-        SQL Server: No native function - use UPPER(LEFT(col,1)) + LOWER(SUBSTRING(col,2,LEN(col)))
-        
+        SQL Server: No native function - emit a VALUES-derived table that
+        binds the argument once and title-cases it via UPPER/LOWER.
+
         Note: This approximation only handles single words. Multi-word strings need custom UDF.
         """
-        if _INITCAP_PATTERN.search(query):
-            self.warnings.append(ConversionWarning(
-                'INITCAP converted to single-word approximation: UPPER(LEFT(col,1)) + LOWER(SUBSTRING(col,2,LEN(col))). '
-                'For multi-word strings ("john doe" → "John Doe"), create a custom scalar UDF or use CLR function.',
-                warning_type='INITCAP'
-            ))
-            
-            def replace_initcap(match):
-                arg = match.group(1).strip()
-                # Generate single-word TitleCase approximation
-                return f"UPPER(LEFT({arg},1)) + LOWER(SUBSTRING({arg},2,LEN({arg})))"
-            
-            return _INITCAP_PATTERN.sub(replace_initcap, query)
-        
-        return query
+        if self._absent('initcap'):
+            return query
+
+        def replace_initcap(match):
+            arg = match.group(1).strip()
+            # Single-word TitleCase approximation; the VALUES table
+            # binds the argument to v so the emitted SQL evaluates it
+            # once instead of three times
+            return (
+                f"(SELECT UPPER(LEFT(v,1)) + LOWER(SUBSTRING(v,2,LEN(v))) "
+                f"FROM (VALUES({arg})) AS _initcap(v))"
+            )
+
+        converted, count = _INITCAP_PATTERN.subn(replace_initcap, query)
+        if not count:
+            return query
+
+        self._warn(ConversionWarning(
+            'INITCAP converted to single-word approximation via a VALUES-derived table: '
+            'UPPER(LEFT(v,1)) + LOWER(SUBSTRING(v,2,LEN(v))). '
+            'For multi-word strings ("john doe" → "John Doe"), create a custom scalar UDF or use CLR function.',
+            warning_type='INITCAP'
+        ))
+        return converted
     
     def _convert_trim(self, query: str) -> str:
         """
@@ -875,19 +1082,22 @@ class OracleToAzureConverter:
         Oracle: TRIM(string)
         SQL Server: TRIM() works in 2017+, but LTRIM(RTRIM()) works in all versions
         """
-        if _TRIM_PATTERN.search(query):
-            self.warnings.append(ConversionWarning(
-                'TRIM() converted to LTRIM(RTRIM(...)) for broad compatibility (SQL Server 2016 and earlier).',
-                warning_type='TRIM'
-            ))
-            
-            def replace_trim(match):
-                arg = match.group(1).strip()
-                return f"LTRIM(RTRIM({arg}))"
-            
-            return _TRIM_PATTERN.sub(replace_trim, query)
-        
-        return query
+        if self._absent('trim'):
+            return query
+
+        def replace_trim(match):
+            arg = match.group(1).strip()
+            return f"LTRIM(RTRIM({arg}))"
+
+        converted, count = _TRIM_PATTERN.subn(replace_trim, query)
+        if not count:
+            return query
+
+        self._warn(ConversionWarning(
+            'TRIM() converted to LTRIM(RTRIM(...)) for broad compatibility (SQL Server 2016 and earlier).',
+            warning_type='TRIM'
+        ))
+        return converted
     
     def _convert_months_between(self, query: str) -> str:
         """
@@ -897,23 +1107,56 @@ class OracleToAzureConverter:
         
         Note: Behavior differs - Oracle returns fractional, SQL Server returns integer.
         """
-        if _MONTHS_BETWEEN_PATTERN.search(query):
-            self.warnings.append(ConversionWarning(
-                'MONTHS_BETWEEN converted to DATEDIFF(MONTH, ...). '
-                'Note: Oracle returns fractional months, SQL Server returns integer months. '
-                'Results may differ if fractional precision is required.',
-                warning_type='MONTHS_BETWEEN'
-            ))
-            
-            def replace_months_between(match):
-                date1 = match.group(1).strip()
-                date2 = match.group(2).strip()
-                # SQL Server DATEDIFF has reversed parameter order
-                return f"DATEDIFF(MONTH, {date2}, {date1})"
-            
-            return _MONTHS_BETWEEN_PATTERN.sub(replace_months_between, query)
-        
-        return query
+        if self._absent('months_between'):
+            return query
+
+        def replace_months_between(match):
+            date1 = match.group(1).strip()
+            date2 = match.group(2).strip()
+            # SQL Server DATEDIFF has reversed parameter order
+            return f"DATEDIFF(MONTH, {date2}, {date1})"
+
+        converted, count = _MONTHS_BETWEEN_PATTERN.subn(replace_months_between, query)
+        if not count:
+            return query
+
+        self._warn(ConversionWarning(
+            'MONTHS_BETWEEN converted to DATEDIFF(MONTH, ...). '
+            'Note: Oracle returns fractional months, SQL Server returns integer months. '
+            'Results may differ if fractional precision is required.',
+            warning_type='MONTHS_BETWEEN'
+        ))
+        return converted
+
+    # Conversion stages in application order, each paired with the scan
+    # token that gates it (None = always runs). Keeping the pipeline as a
+    # table (instead of a hand-coded call sequence in convert()) lets the
+    # driver loop apply, reorder, or skip stages uniformly; convert()
+    # filters it down to the stages whose token is actually present.
+    _PIPELINE = (
+        (_decode_html_entities, None),
+        (_remove_optimizer_hints, '/*+'),
+        (_convert_date_literals, 'date'),
+        (_convert_using_clause, 'using'),
+        (_convert_months_between, 'months_between'),
+        (_convert_fetch_with_ties, 'fetch'),
+        (_convert_instr, 'instr'),
+        (_convert_trim, 'trim'),
+        (_convert_initcap, 'initcap'),
+        (_convert_listagg, 'listagg'),
+        (_convert_regexp_like, 'regexp_like'),
+        (_convert_nvl, 'nvl'),
+        (_convert_decode, 'decode'),
+        (_convert_simple_tokens, None),
+        (_convert_date_trunc, 'trunc'),
+        (_convert_to_char, 'to_char'),
+        (_convert_add_months, 'add_months'),
+        (_convert_rownum_to_top, 'rownum'),
+        (_convert_fetch_first, 'fetch'),
+    )
+    # Tokens that gate at least one stage; the cache key is the subset of
+    # these found in a query
+    _GATE_TOKENS = frozenset(token for _, token in _PIPELINE if token)
 
 
 def convert_oracle_select_to_azure(oracle_query: str) -> Tuple[str, List[ConversionWarning]]:
@@ -934,6 +1177,60 @@ def convert_oracle_select_to_azure(oracle_query: str) -> Tuple[str, List[Convers
         >>> converted, warnings = convert_oracle_select_to_azure(query)
         >>> print(converted)
         SELECT TOP 10 ISNULL(name, 'Unknown') FROM employees
+
+    Note:
+        A shared module-level converter is reused across calls (convert()
+        resets its warning list on entry), so this function is not
+        thread-safe. Create your own OracleToAzureConverter instance for
+        concurrent use.
+    """
+    if not isinstance(oracle_query, str):
+        # Unhashable/invalid input can't go through the cache; let the
+        # converter produce its usual warning
+        return _DEFAULT_CONVERTER.convert(oracle_query)
+    converted, warnings = _cached_convert(oracle_query)
+    # Hand each caller its own list so the cached tuple stays pristine
+    return converted, list(warnings)
+
+
+# Shared instance for the function API; avoids re-allocating a converter
+# per query in batch/CLI/GUI usage
+_DEFAULT_CONVERTER = OracleToAzureConverter()
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_convert(oracle_query: str) -> Tuple[str, Tuple[ConversionWarning, ...]]:
+    """Memoized conversion - QA users re-run the same canonical queries."""
+    converted, warnings = _DEFAULT_CONVERTER.convert(oracle_query)
+    return converted, tuple(warnings)
+
+
+def iter_convert(queries, *, workers: int = 1):
     """
-    converter = OracleToAzureConverter()
-    return converter.convert(oracle_query)
+    Convert a batch of Oracle SELECT queries, yielding one
+    (converted_query, warnings) tuple per input.
+
+    Reuses the shared converter (and its memoized cache) across the whole
+    batch instead of paying per-call setup. With workers > 1, conversions
+    are fanned out to a process pool for CPU-bound batch jobs.
+
+    Args:
+        queries: Iterable of Oracle SQL SELECT query strings
+        workers: Number of worker processes; 1 (the default) converts
+            inline in the calling process
+
+    Yields:
+        Tuple of (converted_azure_query, list_of_warnings) per query,
+        in input order
+    """
+    if workers == 1:
+        for query in queries:
+            yield convert_oracle_select_to_azure(query)
+        return
+    # Imported lazily - the single-process path shouldn't pay for it
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            convert_oracle_select_to_azure, queries, chunksize=64
+        )
@@ -25,20 +25,29 @@ class QueryConverterGUI:
         
         # Track panel orientation (False = normal, True = swapped)
         self.is_swapped = False
+
+        # Whether each text widget currently shows its placeholder, so
+        # focus events don't have to pull the whole buffer to find out
+        self._placeholder_active = {}
         
-        # Configure style
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Create main container
+        # Configure style - a missing theme shouldn't block startup
+        try:
+            ttk.Style().theme_use('clam')
+        except tk.TclError:
+            pass
+
+        # Build the panels the user interacts with first; the warnings
+        # pane and bottom buttons are deferred until the main panels have
+        # painted, which shortens time-to-first-paint
         self.setup_ui()
-        
+        self.root.after_idle(self._finish_ui)
+
         # Set initial focus
         self.left_text.focus_set()
-    
+
     def setup_ui(self):
-        """Set up the user interface."""
-        
+        """Set up the core user interface (title and edit panels)."""
+
         # Title
         title_frame = ttk.Frame(self.root, padding="10")
         title_frame.grid(row=0, column=0, sticky=(tk.W, tk.E))
@@ -58,7 +67,7 @@ class QueryConverterGUI:
         subtitle_label.pack()
         
         # Main content frame
-        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame = self.main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Configure grid weights for resizing
@@ -77,13 +86,15 @@ class QueryConverterGUI:
         
         # Right panel (Azure SQL)
         self.create_right_panel(main_frame)
-        
+
+    def _finish_ui(self):
+        """Build the deferred widgets once the main panels have rendered."""
         # Bottom panel (Warnings and status)
-        self.create_bottom_panel(main_frame)
-        
+        self.create_bottom_panel(self.main_frame)
+
         # Button panel
         self.create_button_panel()
-    
+
     def create_left_panel(self, parent):
         """Create the left panel for Oracle SQL."""
         self.left_frame = ttk.LabelFrame(parent, text="Oracle SQL Query", padding="10")
@@ -112,7 +123,8 @@ WHERE ROWNUM <= 10"""
         
         self.left_text.insert('1.0', placeholder)
         self.left_text.config(fg='gray')
-        
+        self._placeholder_active[self.left_text] = True
+
         # Bind events for placeholder behavior
         self.left_text.bind('<FocusIn>', lambda e: self.on_focus_in(self.left_text, placeholder))
         self.left_text.bind('<FocusOut>', lambda e: self.on_focus_out(self.left_text, placeholder))
@@ -183,7 +195,8 @@ FROM employees"""
         
         self.right_text.insert('1.0', placeholder)
         self.right_text.config(fg='gray')
-        
+        self._placeholder_active[self.right_text] = True
+
         # Bind events for placeholder behavior
         self.right_text.bind('<FocusIn>', lambda e: self.on_focus_in(self.right_text, placeholder))
         self.right_text.bind('<FocusOut>', lambda e: self.on_focus_out(self.right_text, placeholder))
@@ -245,21 +258,33 @@ FROM employees"""
     
     def on_focus_in(self, text_widget, placeholder):
         """Handle focus in event (remove placeholder)."""
-        if text_widget.get('1.0', tk.END).strip() == placeholder.strip():
+        # Flag check keeps this O(1); no buffer copy or string compare
+        if self._placeholder_active.get(text_widget):
             text_widget.delete('1.0', tk.END)
             text_widget.config(fg='black')
-    
+            self._placeholder_active[text_widget] = False
+
     def on_focus_out(self, text_widget, placeholder):
         """Handle focus out event (add placeholder if empty)."""
+        if self._placeholder_active.get(text_widget):
+            return
+        # Cheap first-line probe before falling back to the full buffer
+        if text_widget.get('1.0', '1.end').strip():
+            return
         if not text_widget.get('1.0', tk.END).strip():
             text_widget.insert('1.0', placeholder)
             text_widget.config(fg='gray')
+            self._placeholder_active[text_widget] = True
     
     def convert_oracle_to_azure(self):
         """Convert Oracle SQL to Azure SQL."""
+        if self._placeholder_active.get(self.left_text):
+            self.show_warning('Please enter an Oracle SQL query.')
+            return
+
         oracle_query = self.left_text.get('1.0', tk.END).strip()
-        
-        if not oracle_query or oracle_query.startswith('-- Enter Oracle'):
+
+        if not oracle_query:
             self.show_warning('Please enter an Oracle SQL query.')
             return
         
@@ -271,6 +296,7 @@ FROM employees"""
             self.right_text.config(fg='black')
             self.right_text.delete('1.0', tk.END)
             self.right_text.insert('1.0', azure_query)
+            self._placeholder_active[self.right_text] = False
             
             # Update warnings
             self.update_warnings(warnings, 'Oracle → Azure')
@@ -280,9 +306,13 @@ FROM employees"""
     
     def convert_azure_to_oracle(self):
         """Convert Azure SQL to Oracle SQL."""
+        if self._placeholder_active.get(self.right_text):
+            self.show_warning('Please enter an Azure SQL query.')
+            return
+
         azure_query = self.right_text.get('1.0', tk.END).strip()
-        
-        if not azure_query or azure_query.startswith('-- Enter Azure'):
+
+        if not azure_query:
             self.show_warning('Please enter an Azure SQL query.')
             return
         
@@ -294,6 +324,7 @@ FROM employees"""
             self.left_text.config(fg='black')
             self.left_text.delete('1.0', tk.END)
             self.left_text.insert('1.0', oracle_query)
+            self._placeholder_active[self.left_text] = False
             
             # Update warnings
             self.update_warnings(warnings, 'Azure → Oracle')
@@ -303,8 +334,10 @@ FROM employees"""
     
     def swap_queries(self):
         """Swap the contents of left and right panels."""
-        left_content = self.left_text.get('1.0', tk.END).strip()
-        right_content = self.right_text.get('1.0', tk.END).strip()
+        # 'end-1c' excludes the synthetic trailing newline Tk appends,
+        # so no strip() copy of either buffer is needed
+        left_content = self.left_text.get('1.0', 'end-1c')
+        right_content = self.right_text.get('1.0', 'end-1c')
         
         # Clear both
         self.left_text.delete('1.0', tk.END)
@@ -317,6 +350,8 @@ FROM employees"""
         # Ensure black text
         self.left_text.config(fg='black')
         self.right_text.config(fg='black')
+        self._placeholder_active[self.left_text] = False
+        self._placeholder_active[self.right_text] = False
         
         # Toggle swap state
         self.is_swapped = not self.is_swapped
@@ -342,6 +377,7 @@ FROM employees"""
         """Clear a text widget."""
         text_widget.delete('1.0', tk.END)
         text_widget.config(fg='black')
+        self._placeholder_active[text_widget] = False
     
     def clear_all(self):
         """Clear all text fields."""
@@ -358,10 +394,16 @@ FROM employees"""
         self.warnings_text.delete('1.0', tk.END)
         
         if warnings:
-            self.warnings_text.insert('1.0', f'✓ Conversion complete ({direction})\n\n')
-            self.warnings_text.insert(tk.END, f'{len(warnings)} warning(s):\n')
-            for i, warning in enumerate(warnings, 1):
-                self.warnings_text.insert(tk.END, f'{i}. {warning.message}\n')
+            # Build the report in Python and hand Tk one string; each
+            # insert is a separate Python-to-Tcl round trip
+            parts = [
+                f'✓ Conversion complete ({direction})\n\n',
+                f'{len(warnings)} warning(s):\n',
+            ]
+            parts.extend(
+                f'{i}. {warning.message}\n' for i, warning in enumerate(warnings, 1)
+            )
+            self.warnings_text.insert('1.0', ''.join(parts))
         else:
             self.warnings_text.insert('1.0', f'✓ Conversion complete ({direction}) - No warnings.')
         
@@ -9,10 +9,43 @@ from .converter import ConversionWarning
 _TOP_PATTERN = re.compile(r'\bSELECT\s+TOP\s+(\d+)\s+', re.IGNORECASE)
 _WHERE_PATTERN = re.compile(r'\bWHERE\b', re.IGNORECASE)
 _ORDER_BY_PATTERN_REVERSE = re.compile(r'\bORDER\s+BY\b', re.IGNORECASE)
-_GETDATE_PATTERN = re.compile(r'\bGETDATE\s*\(\s*\)', re.IGNORECASE)
-_ISNULL_PATTERN = re.compile(r'\bISNULL\s*\(((?:[^()]|\([^()]*\))*)\)', re.IGNORECASE)
-_CAST_DATE_PATTERN = re.compile(r'\bCAST\s*\(([^)]+)\s+AS\s+DATE\s*\)', re.IGNORECASE)
+# GETDATE/ISNULL/CAST..AS DATE rewrites fused into one alternation;
+# lastgroup picks the handler, so one scan covers all three functions
+_SCALAR_FUNC_PATTERN = re.compile(
+    r'(?P<getdate>\bGETDATE\s*\(\s*\))'
+    r'|\bISNULL\s*\((?P<isnull>(?:[^()]|\([^()]*\))*)\)'
+    r'|\bCAST\s*\(\s*(?P<castdate>(?:[^()]|\([^()]*\))+?)\s+AS\s+DATE\s*\)',
+    re.IGNORECASE,
+)
 _CASE_WHEN_PATTERN = re.compile(r'\bCASE\s+WHEN\b', re.IGNORECASE)
+# Anchored prefix check; matching stops after the leading whitespace and
+# first keyword instead of case-folding the whole query
+_SELECT_START_PATTERN = re.compile(r'\s*(?:SELECT|WITH)\b', re.IGNORECASE)
+
+# Canned warnings built once at import; ConversionWarning is an immutable
+# NamedTuple, so sharing instances across conversions is safe
+_INVALID_INPUT_WARNING = ConversionWarning(
+    "Invalid input: Query must be a non-empty string."
+)
+_NOT_SELECT_WARNING = ConversionWarning(
+    "Query does not appear to be a SELECT statement."
+)
+_TOP_ORDER_BY_WARNING = ConversionWarning(
+    "TOP converted to ROWNUM with ORDER BY. Results may differ - consider using a subquery."
+)
+_CONCAT_WARNING = ConversionWarning(
+    "String concatenation operator (+) converted to (||). Verify numeric additions are not affected."
+)
+_CASE_WHEN_WARNING = ConversionWarning(
+    "CASE WHEN statement found. Consider converting to DECODE manually for better Oracle compatibility."
+)
+# String-literal tokens ('' is an escaped quote); the concat pass walks
+# these so a + inside a literal is never touched
+_STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+# A + at the very edge of a non-literal segment, i.e. directly adjacent
+# to a string literal
+_PLUS_AFTER_LITERAL_PATTERN = re.compile(r'^(\s*)\+')
+_PLUS_BEFORE_LITERAL_PATTERN = re.compile(r'\+(\s*)$')
 
 
 class AzureToOracleConverter:
@@ -20,7 +53,20 @@ class AzureToOracleConverter:
     
     def __init__(self):
         self.warnings: List[ConversionWarning] = []
-    
+        # Lowercased copy of the query being converted; set once per
+        # convert() so each pass can probe for its token with a C-level
+        # substring test before paying for a regex scan
+        self._q_lower = None
+
+    def _absent(self, token: str) -> bool:
+        """True when the current query provably lacks `token`.
+
+        Conservative: returns False when no lowercased copy is available
+        (e.g. a pass invoked outside convert()), so the pass still runs.
+        """
+        q_lower = self._q_lower
+        return q_lower is not None and token not in q_lower
+
     def convert(self, azure_query: str) -> Tuple[str, List[ConversionWarning]]:
         """
         Convert an Azure SQL SELECT query to Oracle format.
@@ -35,109 +81,196 @@ class AzureToOracleConverter:
         
         # Input validation
         if not azure_query or not isinstance(azure_query, str):
-            self.warnings.append(
-                ConversionWarning("Invalid input: Query must be a non-empty string.")
-            )
+            self.warnings.append(_INVALID_INPUT_WARNING)
             return azure_query if azure_query else "", self.warnings
         
         # Validate it's a SELECT query
         if not self._is_select_query(azure_query):
-            self.warnings.append(
-                ConversionWarning("Query does not appear to be a SELECT statement.")
-            )
+            self.warnings.append(_NOT_SELECT_WARNING)
             return azure_query, self.warnings
         
+        # Lowercase once; passes probe this instead of scanning for
+        # tokens that aren't there
+        self._q_lower = azure_query.lower()
+
         # Apply reverse conversions
         converted = azure_query
         converted = self._convert_top_to_rownum(converted)
-        converted = self._convert_getdate(converted)
-        converted = self._convert_isnull(converted)
-        converted = self._convert_string_concatenation(converted)
-        converted = self._convert_cast_date(converted)
+        converted = self._convert_scalar_functions(converted)
+        # Guard at the call site so concat-free queries skip the frame
+        # entirely; the helper keeps its own guard for direct callers
+        if '+' in converted and "'" in converted:
+            converted = self._convert_string_concatenation(converted)
         converted = self._convert_case_to_decode(converted)
-        
+
+        self._q_lower = None
         return converted, self.warnings
     
     def _is_select_query(self, query: str) -> bool:
         """Check if query is a SELECT statement."""
-        query_upper = query.strip().upper()
-        return query_upper.startswith('SELECT') or query_upper.startswith('WITH')
+        return _SELECT_START_PATTERN.match(query) is not None
     
     def _convert_top_to_rownum(self, query: str) -> str:
         """
         Convert SELECT TOP N to WHERE ROWNUM <= N.
         Note: This is a basic conversion. Complex TOP usage may need manual review.
         """
-        match = _TOP_PATTERN.search(query)
-        
-        if not match:
+        if self._absent('top'):
             return query
-        
-        limit = match.group(1)
-        converted = _TOP_PATTERN.sub('SELECT ', query)
-        
-        # Add WHERE ROWNUM <= N (or extend existing WHERE)
-        if _WHERE_PATTERN.search(converted):
-            converted = _WHERE_PATTERN.sub(f'WHERE ROWNUM <= {limit} AND', converted, count=1)
-        elif _ORDER_BY_PATTERN_REVERSE.search(converted):
-            converted = _ORDER_BY_PATTERN_REVERSE.sub(f'WHERE ROWNUM <= {limit} ORDER BY', converted, count=1)
+        matches = list(_TOP_PATTERN.finditer(query))
+        if not matches:
+            return query
+
+        # Limit comes from the first TOP; splice the clauses out by match
+        # offsets instead of paying for another full-scan sub
+        limit = matches[0].group(1)
+        pieces = []
+        pos = 0
+        for match in matches:
+            pieces.append(query[pos:match.start()])
+            pieces.append('SELECT ')
+            pos = match.end()
+        pieces.append(query[pos:])
+        converted = ''.join(pieces)
+
+        # Add WHERE ROWNUM <= N (or extend existing WHERE); each
+        # case-insensitive scan runs at most once and the match offsets
+        # drive the splice directly
+        has_order_by = False
+        where_match = _WHERE_PATTERN.search(converted)
+        if where_match:
+            converted = (
+                converted[:where_match.start()]
+                + f'WHERE ROWNUM <= {limit} AND'
+                + converted[where_match.end():]
+            )
+            has_order_by = _ORDER_BY_PATTERN_REVERSE.search(converted) is not None
         else:
-            converted = converted.rstrip() + f'\nWHERE ROWNUM <= {limit}'
-        
+            order_match = _ORDER_BY_PATTERN_REVERSE.search(converted)
+            if order_match:
+                converted = (
+                    converted[:order_match.start()]
+                    + f'WHERE ROWNUM <= {limit} ORDER BY'
+                    + converted[order_match.end():]
+                )
+                has_order_by = True
+            else:
+                converted = converted.rstrip() + f'\nWHERE ROWNUM <= {limit}'
+
         # Warn about ORDER BY
-        if _ORDER_BY_PATTERN_REVERSE.search(converted):
-            self.warnings.append(
-                ConversionWarning("TOP converted to ROWNUM with ORDER BY. Results may differ - consider using a subquery.")
-            )
-        
+        if has_order_by:
+            self.warnings.append(_TOP_ORDER_BY_WARNING)
+
         return converted
     
-    def _convert_getdate(self, query: str) -> str:
-        """Convert GETDATE() to SYSDATE."""
-        return _GETDATE_PATTERN.sub('SYSDATE', query)
-    
-    def _convert_isnull(self, query: str) -> str:
-        """Convert ISNULL(a, b) to NVL(a, b)."""
-        return _ISNULL_PATTERN.sub(lambda m: f"NVL({m.group(1)})", query)
-    
+    def _convert_scalar_functions(self, query: str) -> str:
+        """Convert GETDATE() to SYSDATE, ISNULL(a, b) to NVL(a, b) and
+        CAST(date_col AS DATE) to TRUNC(date_col) in one pass."""
+        if (
+            self._absent('getdate')
+            and self._absent('isnull')
+            and self._absent('cast')
+        ):
+            return query
+        # The argument groups tolerate only one level of nested parens,
+        # so a deeply nested call like ISNULL(CAST(GETDATE() AS DATE), d)
+        # is only partially converted per pass. Re-run to a fixed point:
+        # each round flattens the innermost calls and no replacement
+        # reintroduces a convertible token, so this terminates quickly.
+        converted = _SCALAR_FUNC_PATTERN.sub(self._scalar_func_repl, query)
+        while converted != query:
+            query = converted
+            converted = _SCALAR_FUNC_PATTERN.sub(self._scalar_func_repl, query)
+        return converted
+
+    def _scalar_func_repl(self, match) -> str:
+        group = match.lastgroup
+        if group == 'getdate':
+            return 'SYSDATE'
+        # ISNULL/CAST arguments may themselves contain fused functions
+        # (e.g. ISNULL(GETDATE(), d)), so recurse into the captured text
+        inner = _SCALAR_FUNC_PATTERN.sub(self._scalar_func_repl, match.group(group))
+        if group == 'isnull':
+            return f"NVL({inner})"
+        return f"TRUNC({inner})"
+
     def _convert_string_concatenation(self, query: str) -> str:
         """
         Convert + to || for string concatenation.
         Note: This is a heuristic and may not be perfect for numeric addition.
         """
-        if '+' in query and "'" in query:
-            converted = query.replace(' + ', ' || ')
-            self.warnings.append(
-                ConversionWarning("String concatenation operator (+) converted to (||). Verify numeric additions are not affected.")
+        if '+' not in query or "'" not in query:
+            return query
+        # Tokenize on string literals and rewrite only the + operators
+        # sitting at a literal boundary in the code between them; a +
+        # inside a literal ('A+', 'C++') or in plain numeric addition
+        # (price + tax) is never touched
+        pieces = []
+        pos = 0
+        count = 0
+        after_literal = False
+        for match in _STRING_LITERAL_PATTERN.finditer(query):
+            gap, n = self._rewrite_adjacent_plus(
+                query[pos:match.start()], after_literal, True
             )
-            return converted
-        return query
-    
-    def _convert_cast_date(self, query: str) -> str:
-        """Convert CAST(date_col AS DATE) to TRUNC(date_col)."""
-        return _CAST_DATE_PATTERN.sub(lambda m: f"TRUNC({m.group(1).strip()})", query)
+            count += n
+            pieces.append(gap)
+            pieces.append(match.group())
+            pos = match.end()
+            after_literal = True
+        tail, n = self._rewrite_adjacent_plus(query[pos:], after_literal, False)
+        count += n
+        pieces.append(tail)
+
+        if not count:
+            return query
+        self.warnings.append(_CONCAT_WARNING)
+        return ''.join(pieces)
+
+    @staticmethod
+    def _rewrite_adjacent_plus(gap: str, follows_literal: bool,
+                               precedes_literal: bool) -> Tuple[str, int]:
+        """Rewrite + at the edges of a non-literal segment to ||.
+
+        Only the edges can be concatenation: a + elsewhere in the segment
+        has no string-literal operand.
+        """
+        count = 0
+        if '+' in gap:
+            if follows_literal:
+                gap, n = _PLUS_AFTER_LITERAL_PATTERN.subn(r'\1||', gap)
+                count += n
+            if precedes_literal:
+                gap, n = _PLUS_BEFORE_LITERAL_PATTERN.subn(r'||\1', gap)
+                count += n
+        return gap, count
     
     def _convert_case_to_decode(self, query: str) -> str:
         """
         Convert simple CASE WHEN to DECODE.
         Only converts simple equality cases.
         """
+        if self._absent('case'):
+            return query
         if _CASE_WHEN_PATTERN.search(query):
-            self.warnings.append(
-                ConversionWarning("CASE WHEN statement found. Consider converting to DECODE manually for better Oracle compatibility.")
-            )
+            self.warnings.append(_CASE_WHEN_WARNING)
         return query
 
 
+# Shared converter for the module-level entry point; convert() resets
+# its per-query state, so reusing one instance avoids an allocation per
+# call. Not thread-safe - threaded callers should hold their own instance.
+_DEFAULT_CONVERTER = AzureToOracleConverter()
+
+
 def convert_azure_select_to_oracle(azure_query: str) -> Tuple[str, List[ConversionWarning]]:
     """
     Convert an Azure SQL SELECT query to Oracle format.
-    
+
     Args:
         azure_query: Azure SQL SELECT query string
-        
+
     Returns:
         Tuple of (converted_oracle_query, list_of_warnings)
     """
-    converter = AzureToOracleConverter()
-    return converter.convert(azure_query)
+    return _DEFAULT_CONVERTER.convert(azure_query)
@@ -6,6 +6,40 @@ Run this after each conversion to verify quality.
 from oracle_to_azure_select_converter import convert_oracle_select_to_azure
 import re
 
+# Oracle-only functions that must not survive conversion, detected with
+# a single alternation so one scan covers every name
+_ORACLE_FUNCTIONS = ('NVL', 'DECODE', 'TRUNC', 'ADD_MONTHS', 'SUBSTR', 'TO_CHAR', 'LISTAGG', 'SYSDATE', 'ROWNUM')
+_ORACLE_FUNCS_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, _ORACLE_FUNCTIONS)) + r')\s*\(', re.IGNORECASE
+)
+_LINE_COMMENT_RE = re.compile(r'--.*$', re.MULTILINE)
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+# All leftover HTML entities found in one alternation scan instead of
+# one substring pass per entity
+_HTML_ENTITY_RE = re.compile(r'&(?:gt|lt|amp|quot|apos|nbsp);')
+_HTML_ENTITY_MAP = {
+    '&gt;': '>',
+    '&lt;': '<',
+    '&amp;': '&',
+    '&quot;': '"',
+    '&apos;': "'",
+    '&nbsp;': ' ',
+}
+_STRING_AGG_DISTINCT_RE = re.compile(
+    r'SELECT\s+STRING_AGG.*?FROM\s*\(\s*SELECT\s+DISTINCT', re.IGNORECASE | re.DOTALL
+)
+_HAS_SELECT_RE = re.compile(r'\bSELECT\b', re.IGNORECASE)
+
+
+def fix_html_entities(sql: str) -> str:
+    """
+    Replace leftover HTML entities (e.g. &lt;= back to <=) in one pass.
+    Companion to the html_entities check for queries that fail it.
+    """
+    if '&' not in sql:
+        return sql
+    return _HTML_ENTITY_RE.sub(lambda m: _HTML_ENTITY_MAP[m.group()], sql)
+
 
 def run_qa_checklist(converted_sql: str, warnings: list) -> dict:
     """
@@ -14,9 +48,9 @@ def run_qa_checklist(converted_sql: str, warnings: list) -> dict:
     """
     results = {}
     
-    # Check 1: No HTML entities remain
-    html_entities = ['&gt;', '&lt;', '&amp;', '&quot;', '&apos;', '&nbsp;']
-    found_entities = [e for e in html_entities if e in converted_sql]
+    # Check 1: No HTML entities remain (one scan for all six entities)
+    entity_hits = set(_HTML_ENTITY_RE.findall(converted_sql))
+    found_entities = [e for e in ('&gt;', '&lt;', '&amp;', '&quot;', '&apos;', '&nbsp;') if e in entity_hits]
     results['html_entities'] = {
         'pass': len(found_entities) == 0,
         'message': 'No HTML entities remain' if len(found_entities) == 0 else f'Found HTML entities: {", ".join(found_entities)}',
@@ -24,34 +58,27 @@ def run_qa_checklist(converted_sql: str, warnings: list) -> dict:
     }
     
     # Check 2: No Oracle-only functions remain
-    oracle_functions = ['NVL', 'DECODE', 'TRUNC', 'ADD_MONTHS', 'SUBSTR', 'TO_CHAR', 'LISTAGG', 'SYSDATE', 'ROWNUM']
-    # Use word boundaries to avoid false positives in comments or strings
-    found_functions = []
-    for func in oracle_functions:
-        # Look for function calls (not in comments)
-        pattern = rf'\b{func}\s*\('
-        if re.search(pattern, converted_sql, re.IGNORECASE):
-            # Verify it's not in a comment
-            lines = converted_sql.split('\n')
-            for line in lines:
-                # Remove SQL comments
-                code_part = re.sub(r'--.*$', '', line)
-                code_part = re.sub(r'/\*.*?\*/', '', code_part)
-                if re.search(pattern, code_part, re.IGNORECASE):
-                    found_functions.append(func)
-                    break
-    
+    # Strip SQL comments once, then look for function calls with word
+    # boundaries to avoid false positives in strings
+    stripped_sql = _BLOCK_COMMENT_RE.sub('', _LINE_COMMENT_RE.sub('', converted_sql))
+    found_functions = {
+        m.group(1).upper() for m in _ORACLE_FUNCS_RE.finditer(stripped_sql)
+    }
+
     results['oracle_functions'] = {
         'pass': len(found_functions) == 0,
         'message': 'All Oracle functions converted' if len(found_functions) == 0 else f'Oracle functions still present: {", ".join(set(found_functions))}',
         'severity': 'CRITICAL' if found_functions else 'OK'
     }
     
+    # One uppercase copy shared by the substring probes below
+    upper_sql = converted_sql.upper()
+
     # Check 3: STRING_AGG with DISTINCT uses derived set
-    has_string_agg = 'STRING_AGG' in converted_sql.upper()
+    has_string_agg = 'STRING_AGG' in upper_sql
     if has_string_agg:
         # Check if DISTINCT is preserved via subquery pattern
-        has_distinct_pattern = bool(re.search(r'SELECT\s+STRING_AGG.*?FROM\s*\(\s*SELECT\s+DISTINCT', converted_sql, re.IGNORECASE | re.DOTALL))
+        has_distinct_pattern = bool(_STRING_AGG_DISTINCT_RE.search(converted_sql))
         has_placeholder = '<source_table>' in converted_sql
         
         if has_distinct_pattern:
@@ -82,7 +109,7 @@ def run_qa_checklist(converted_sql: str, warnings: list) -> dict:
         }
     
     # Check 4: REGEXP_LIKE handling
-    has_regexp = 'REGEXP_LIKE' in converted_sql.upper()
+    has_regexp = 'REGEXP_LIKE' in upper_sql
     if has_regexp:
         # Check for version warning
         has_warning = any(
@@ -106,16 +133,19 @@ def run_qa_checklist(converted_sql: str, warnings: list) -> dict:
     # Check 5: Syntax checks (basic)
     syntax_issues = []
     
-    # Check for common syntax errors
-    if '&gt;' in converted_sql or '&lt;' in converted_sql:
+    # Check for common syntax errors, reusing the entity scan from check 1
+    if '&gt;' in entity_hits or '&lt;' in entity_hits:
         syntax_issues.append('HTML entities in operators')
-    
-    # Check for balanced parentheses
-    if converted_sql.count('(') != converted_sql.count(')'):
-        syntax_issues.append(f'Unbalanced parentheses: {converted_sql.count("(")} open, {converted_sql.count(")")} close')
+
+    # Check for balanced parentheses; str.count is a single C-level scan
+    # per character, so count each paren once and reuse the totals
+    open_parens = converted_sql.count('(')
+    close_parens = converted_sql.count(')')
+    if open_parens != close_parens:
+        syntax_issues.append(f'Unbalanced parentheses: {open_parens} open, {close_parens} close')
     
     # Check for basic SQL structure
-    if not re.search(r'\bSELECT\b', converted_sql, re.IGNORECASE):
+    if not _HAS_SELECT_RE.search(converted_sql):
         syntax_issues.append('Missing SELECT keyword')
     
     results['syntax'] = {
@@ -124,17 +154,26 @@ def run_qa_checklist(converted_sql: str, warnings: list) -> dict:
         'severity': 'CRITICAL' if syntax_issues else 'OK'
     }
     
-    # Overall pass/fail
-    critical_fails = [k for k, v in results.items() if v['severity'] == 'CRITICAL' and not v['pass']]
-    warnings_count = [k for k, v in results.items() if v['severity'] == 'WARNING' and not v['pass']]
-    
+    # Overall pass/fail: one walk over the checks, every value here is a
+    # check dict with 'pass' and 'severity' keys
+    passed = 0
+    critical_fails = 0
+    warning_fails = 0
+    for check in results.values():
+        if check['pass']:
+            passed += 1
+        elif check['severity'] == 'CRITICAL':
+            critical_fails += 1
+        elif check['severity'] == 'WARNING':
+            warning_fails += 1
+
     results['_summary'] = {
         'total_checks': len(results) - 1,  # Exclude summary itself
-        'passed': sum(1 for v in results.values() if isinstance(v, dict) and v.get('pass', False)),
-        'critical_failures': len(critical_fails),
-        'warnings': len(warnings_count),
-        'overall_status': 'PASS' if len(critical_fails) == 0 else 'FAIL',
-        'ready_for_execution': len(critical_fails) == 0 and len(warnings_count) == 0
+        'passed': passed,
+        'critical_failures': critical_fails,
+        'warnings': warning_fails,
+        'overall_status': 'PASS' if critical_fails == 0 else 'FAIL',
+        'ready_for_execution': critical_fails == 0 and warning_fails == 0
     }
     
     return results
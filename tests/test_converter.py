@@ -3,7 +3,10 @@ Unit tests for Oracle to Azure SQL SELECT query converter.
 """
 
 import pytest
-from oracle_to_azure_select_converter import convert_oracle_select_to_azure
+from oracle_to_azure_select_converter import (
+    convert_azure_select_to_oracle,
+    convert_oracle_select_to_azure,
+)
 
 
 class TestBasicConversions:
@@ -181,6 +184,48 @@ FROM table1"""
         assert "\n" in converted
 
 
+class TestReverseScalarFunctions:
+    """Test GETDATE/ISNULL/CAST conversion in the Azure to Oracle direction."""
+
+    def test_isnull_wrapping_cast_getdate(self):
+        """Test deeply nested ISNULL(CAST(GETDATE() AS DATE), x) converts fully."""
+        query = "SELECT ISNULL(CAST(GETDATE() AS DATE), d) FROM t"
+        converted, warnings = convert_azure_select_to_oracle(query)
+        assert "NVL(TRUNC(SYSDATE), d)" in converted
+        assert "ISNULL" not in converted.upper()
+        assert "CAST" not in converted.upper()
+
+
+class TestReverseStringConcatenation:
+    """Test + to || conversion in the Azure to Oracle direction."""
+
+    def test_plus_adjacent_to_literal_converted(self):
+        """Test + next to a string literal becomes ||."""
+        query = "SELECT 'Dr. ' + last_name FROM employees"
+        converted, warnings = convert_azure_select_to_oracle(query)
+        assert "'Dr. ' || last_name" in converted
+
+    def test_numeric_addition_untouched(self):
+        """Test numeric addition survives even with a literal elsewhere."""
+        query = "SELECT price + tax FROM orders WHERE status = 'OPEN'"
+        converted, warnings = convert_azure_select_to_oracle(query)
+        assert "price + tax" in converted
+
+    def test_plus_inside_literal_untouched(self):
+        """Test a + that is the last character of a literal is preserved."""
+        query = "SELECT * FROM students WHERE grade = 'A+'"
+        converted, warnings = convert_azure_select_to_oracle(query)
+        assert "'A+'" in converted
+        assert "||" not in converted
+
+    def test_multiple_plus_inside_literal_untouched(self):
+        """Test consecutive + characters inside a literal are preserved."""
+        query = "SELECT 'C++' AS lang FROM skills"
+        converted, warnings = convert_azure_select_to_oracle(query)
+        assert "'C++'" in converted
+        assert "||" not in converted
+
+
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
     